@@ -1,1035 +1,1767 @@
-import os
-import sys
-import threading
-import subprocess
-import shutil
-import json
-import time
-from pathlib import Path
-import re
-import tempfile
-import tkinter as tk
-import winsound
-from tkinter import ttk, filedialog, messagebox
-
-"""
-Shotcut Auto-Cut GUI (Tkinter)
---------------------------------
-This GUI lets you automatically cut out low-volume (silent) parts of videos.
-It supports two backends:
-
-1. Auto-Editor (recommended)
-   - https://auto-editor.com
-   - Detects and removes silence intelligently.
-   - Allows margins and smart clip detection.
-
-2. FFmpeg “silenceremove” (simple fallback)
-   - Requires ffmpeg in PATH.
-   - Removes low-volume parts directly from audio stream.
-
-New in this version:
-- Folder (batch) mode: process all videos in a folder (non-recursive)
-- Skips files that already contain "_autocut" in the name
-- After batch, builds <foldername>_ALL_autocut.mp4 by concatenating outputs in numeric order
-"""
-
-APP_TITLE = "Shotcut Auto-Cut GUI (Silence/Low-Volume)"
-
-# Frame extraction: save 1 out of every N frames (N=30 by default)
-FRAME_EXTRACT_INTERVAL = 30
-
-DEFAULTS = {
-    "backend": "Auto-Editor",
-    "threshold_db": -30.0,
-    "min_silence": 1.35,
-    "margin": 0.5,
-    "crossfade": 0.0,    # <--- NEW
-    "audio_track": 0,
-    "min_clip_len": 0.58,
-    "ffmpeg_path": "",
-    "extract_frames": False,
-    "frames_folder": "",
-}
-VIDEO_EXTS = {".mp4", ".mov", ".mkv", ".avi", ".m4v", ".webm", ".wmv", ".flv"}
-
-
-def which(program: str):
-    """Cross-platform which wrapper."""
-    return shutil.which(program)
-
-
-def run_subprocess(cmd_list, log_callback, cwd=None, *, stop_event=None, proc_setter=None):
-    """
-    Run a subprocess and stream stdout/stderr to log_callback.
-
-    - stop_event: threading.Event (optional). If set, the process will be terminated.
-    - proc_setter: callable(proc|None) (optional). Lets the GUI store the active Popen handle.
-    """
-    creationflags = 0
-    startupinfo = None
-    if os.name == "nt":
-        # Prevent flashing console windows on Windows
-        creationflags = subprocess.CREATE_NO_WINDOW
-
-    try:
-        proc = subprocess.Popen(
-            cmd_list,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            cwd=cwd,
-            text=True,
-            encoding="utf-8",
-            errors="replace",  # prevent UnicodeDecodeError on Windows
-            bufsize=1,
-            universal_newlines=True,
-            creationflags=creationflags,
-            startupinfo=startupinfo,
-        )
-        if proc_setter:
-            try:
-                proc_setter(proc)
-            except Exception:
-                pass
-
-        # Stream output
-        assert proc.stdout is not None
-        for line in proc.stdout:
-            if stop_event is not None and stop_event.is_set():
-                try:
-                    proc.terminate()
-                except Exception:
-                    pass
-                break
-            log_callback(line.rstrip())
-
-        proc.wait()
-        return proc.returncode
-    except FileNotFoundError as e:
-        log_callback(f"ERROR: {e}")
-        return 127
-    except Exception as e:
-        log_callback(f"ERROR running subprocess: {e}")
-        return 1
-    finally:
-        if proc_setter:
-            try:
-                proc_setter(None)
-            except Exception:
-                pass
-
-
-# --------------------------
-# Auto-Editor backend
-# --------------------------
-
-class AutoEditorBackend:
-    """Wrapper for Auto-Editor CLI (new v24+ syntax)"""
-
-    def __init__(self, settings, log, stop_event=None, proc_setter=None):
-        self.settings = settings
-        self.log = log
-        self.stop_event = stop_event
-        self.proc_setter = proc_setter
-
-    def ensure_installed(self) -> bool:
-        exe = which("auto-editor")
-        if exe:
-            self.log(f"Found auto-editor at: {exe}")
-            return True
-        self.log("auto-editor not found. Attempting installation via pip...")
-        cmd = [sys.executable, "-m", "pip", "install", "--upgrade", "auto-editor"]
-        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-        if rc == 0 and which("auto-editor"):
-            self.log("auto-editor installed successfully.")
-            return True
-        self.log("ERROR: Unable to install or locate auto-editor.")
-        return False
-
-    def build_cmd(self, input_path: Path, output_path: Path):
-        s = self.settings
-
-        # Gather settings
-        threshold_db = float(s["threshold_db"])
-        margin = float(s["margin"])
-        crossfade = float(s.get("crossfade", 0.0))
-
-        edit_arg = f"audio:threshold={threshold_db}dB"
-
-        cmd = [
-            "auto-editor",
-            str(input_path),
-            "--edit", edit_arg,
-            "--margin", f"{margin}sec",
-            "--output", str(output_path),
-            "--no_open"
-        ]
-
-        # Add crossfade if requested
-        if crossfade > 0:
-            cmd.extend(["--add-transition", f"fade:{crossfade}sec"])
-
-        return cmd
-
-    def run(self, input_path: Path, output_path: Path):
-        if not self.ensure_installed():
-            return 1
-
-        cmd = self.build_cmd(input_path, output_path)
-        self.log("Running: " + " ".join(cmd))
-        return run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-
-# --------------------------
-# FFmpeg backend
-# --------------------------
-
-class FFmpegBackend:
-    """
-    FFmpeg backend with real crossfade support.
-
-    Pipeline:
-      1) Detect silence with silencedetect
-      2) Convert silence intervals -> kept intervals (non-silent), applying margin and min_clip_len
-      3) Cut kept intervals into temp segment files (re-encoded for accurate cuts)
-      4) Join:
-          - crossfade == 0: concat demuxer (hard cuts)
-          - crossfade  > 0: xfade + acrossfade chain (true A/V crossfades)
-    """
-
-    def __init__(self, settings, log, stop_event=None, proc_setter=None):
-        self.settings = settings
-        self.log = log
-        self.stop_event = stop_event
-        self.proc_setter = proc_setter
-
-    def get_ffmpeg(self) -> str:
-        user_path = (self.settings.get("ffmpeg_path", "") or "").strip()
-        if user_path:
-            return user_path
-        exe = which("ffmpeg")
-        if exe:
-            return exe
-        return "ffmpeg"
-
-    def get_ffprobe(self) -> str:
-        ffmpeg = self.get_ffmpeg()
-        try:
-            p = Path(ffmpeg)
-            # If user provided an absolute path, prefer sibling ffprobe(.exe)
-            if p.suffix.lower() == ".exe" or p.name.lower().startswith("ffmpeg"):
-                cand = p.with_name("ffprobe.exe" if p.suffix.lower() == ".exe" else "ffprobe")
-                if cand.exists():
-                    return str(cand)
-        except Exception:
-            pass
-        exe = which("ffprobe")
-        if exe:
-            return exe
-        return "ffprobe"
-
-    def _check_cancelled(self):
-        if self.stop_event is not None and self.stop_event.is_set():
-            raise RuntimeError("Cancelled by user.")
-
-    def _probe_duration(self, video: Path) -> float:
-        ffprobe = self.get_ffprobe()
-        cmd = [
-            ffprobe, "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video)
-        ]
-        creationflags = 0
-        if os.name == "nt":
-            creationflags = subprocess.CREATE_NO_WINDOW
-        try:
-            r = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                               text=True, encoding="utf-8", errors="replace",
-                               creationflags=creationflags)
-            return float((r.stdout or "").strip() or 0.0)
-        except Exception:
-            return 0.0
-
-    def _detect_silence(self, input_path: Path, threshold_db: float, min_silence: float):
-        """
-        Returns a list of (silence_start, silence_end) in seconds.
-        silence_end may be None if silence runs to EOF (we'll fix up using duration).
-        """
-        ffmpeg = self.get_ffmpeg()
-        # silencedetect prints to stderr normally; we redirect to stdout in run_subprocess,
-        # so we just parse lines in the log sink.
-        lines = []
-
-        def _cap(line: str):
-            lines.append(line)
-            # also forward to GUI
-            self.log(line)
-
-        cmd = [
-            ffmpeg, "-hide_banner", "-nostats", "-i", str(input_path),
-            "-af", f"silencedetect=noise={threshold_db}dB:d={min_silence}",
-            "-f", "null", "-"
-        ]
-        self.log("Detecting silence via FFmpeg silencedetect...")
-        rc = run_subprocess(cmd, _cap, stop_event=self.stop_event, proc_setter=self.proc_setter)
-        if rc != 0:
-            raise RuntimeError(f"FFmpeg silencedetect failed (exit {rc}).")
-
-        silences = []
-        start = None
-        for line in lines:
-            m1 = re.search(r"silence_start:\s*([0-9.]+)", line)
-            if m1:
-                start = float(m1.group(1))
-                continue
-            m2 = re.search(r"silence_end:\s*([0-9.]+)", line)
-            if m2 and start is not None:
-                end = float(m2.group(1))
-                silences.append((start, end))
-                start = None
-
-        if start is not None:
-            silences.append((start, None))
-
-        return silences
-
-    def _invert_to_kept(self, duration: float, silences, margin: float, min_clip_len: float):
-        """
-        Convert silence intervals -> kept (non-silent) intervals.
-        Apply margin by expanding each silence interval by +/- margin.
-        """
-        if duration <= 0:
-            # best-effort
-            return [(0.0, None)]
-
-        # Expand silence intervals by margin, then clamp
-        expanded = []
-        for s0, s1 in silences:
-            a = max(0.0, float(s0) - margin)
-            b = None if s1 is None else min(duration, float(s1) + margin)
-            expanded.append((a, b))
-
-        # Merge overlapping expanded silences
-        expanded.sort(key=lambda x: x[0])
-        merged = []
-        for a, b in expanded:
-            if not merged:
-                merged.append([a, b])
-                continue
-            pa, pb = merged[-1]
-            pb_val = duration if pb is None else pb
-            b_val = duration if b is None else b
-            if a <= pb_val:
-                # overlap/adjacent
-                merged[-1][1] = None if (pb is None or b is None) else max(pb, b)
-            else:
-                merged.append([a, b])
-
-        # Invert
-        kept = []
-        cur = 0.0
-        for a, b in merged:
-            end_a = a
-            if end_a - cur >= min_clip_len:
-                kept.append((cur, end_a))
-            cur = duration if b is None else b
-        if duration - cur >= min_clip_len:
-            kept.append((cur, duration))
-
-        return kept
-
-    def _cut_segment(self, input_path: Path, out_path: Path, start: float, end: float):
-        self._check_cancelled()
-        ffmpeg = self.get_ffmpeg()
-
-        # Accurate cuts: re-encode. Keep it reasonably fast + compatible.
-        cmd = [
-            ffmpeg, "-hide_banner", "-y",
-            "-ss", f"{start:.6f}", "-to", f"{end:.6f}",
-            "-i", str(input_path),
-            "-c:v", "libx264", "-crf", "18", "-preset", "veryfast",
-            "-pix_fmt", "yuv420p",
-            "-c:a", "aac", "-b:a", "192k",
-            str(out_path)
-        ]
-        self.log(f"Cut segment: {start:.2f}s → {end:.2f}s")
-        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-        if rc != 0:
-            raise RuntimeError(f"FFmpeg segment cut failed (exit {rc}).")
-
-    def _concat_hard(self, segments, output_path: Path):
-        self._check_cancelled()
-        ffmpeg = self.get_ffmpeg()
-        list_file = output_path.with_suffix(".concat.txt")
-        with list_file.open("w", encoding="utf-8") as f:
-            for seg in segments:
-                # concat demuxer needs: file 'path'
-                path_str = str(seg).replace("'", "'\\''")
-                f.write("file '" + path_str + "'\n")
-
-        cmd = [
-            ffmpeg, "-hide_banner", "-y",
-            "-f", "concat", "-safe", "0",
-            "-i", str(list_file),
-            "-c", "copy",
-            str(output_path)
-        ]
-        self.log("Concatenating (hard cuts)...")
-        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-        if rc != 0:
-            # Fallback: re-encode concat (more compatible)
-            self.log("Hard concat with -c copy failed; retrying with re-encode...")
-            cmd = [
-                ffmpeg, "-hide_banner", "-y",
-                "-f", "concat", "-safe", "0",
-                "-i", str(list_file),
-                "-c:v", "libx264", "-crf", "18", "-preset", "veryfast",
-                "-pix_fmt", "yuv420p",
-                "-c:a", "aac", "-b:a", "192k",
-                str(output_path)
-            ]
-            rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-        try:
-            list_file.unlink(missing_ok=True)
-        except Exception:
-            pass
-        return rc
-
-    def _concat_crossfade(self, segments, durations, crossfade: float, output_path: Path):
-        """
-        Build a chained xfade/acrossfade graph.
-        """
-        self._check_cancelled()
-        ffmpeg = self.get_ffmpeg()
-        n = len(segments)
-        if n == 1:
-            shutil.copy2(segments[0], output_path)
-            return 0
-
-        # Build filter_complex
-        fc_lines = []
-        # Labels for each input stream
-        # [0:v][0:a], [1:v][1:a], etc.
-
-        # Chain video xfade
-        cum = durations[0]
-        v_label = "[0:v]"
-        a_label = "[0:a]"
-        for i in range(1, n):
-            in_v = f"[{i}:v]"
-            in_a = f"[{i}:a]"
-            out_v = f"[v{i}]"
-            out_a = f"[a{i}]"
-            offset = max(0.0, cum - crossfade)
-            fc_lines.append(f"{v_label}{in_v}xfade=transition=fade:duration={crossfade}:offset={offset}{out_v}")
-            fc_lines.append(f"{a_label}{in_a}acrossfade=d={crossfade}{out_a}")
-            cum = cum + durations[i] - crossfade
-            v_label = out_v
-            a_label = out_a
-
-        filter_complex = ";".join(fc_lines)
-
-        cmd = [ffmpeg, "-hide_banner", "-y"]
-        for seg in segments:
-            cmd.extend(["-i", str(seg)])
-
-        cmd.extend([
-            "-filter_complex", filter_complex,
-            "-map", v_label,
-            "-map", a_label,
-            "-c:v", "libx264", "-crf", "18", "-preset", "veryfast",
-            "-pix_fmt", "yuv420p",
-            "-c:a", "aac", "-b:a", "192k",
-            str(output_path)
-        ])
-
-        self.log("Concatenating with true crossfade...")
-        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-        return rc
-
-    def run(self, input_path: Path, output_path: Path):
-        s = self.settings
-        threshold_db = float(s["threshold_db"])
-        min_silence = float(s["min_silence"])
-        margin = float(s.get("margin", 0.0))
-        crossfade = float(s.get("crossfade", 0.0))
-        min_clip_len = float(s.get("min_clip_len", 0.0))
-
-        # If user asks for crossfade but margin/min_clip_len are zero-ish, still do it.
-        duration = self._probe_duration(input_path)
-        self.log(f"Duration: {duration:.2f}s")
-
-        silences = self._detect_silence(input_path, threshold_db=threshold_db, min_silence=min_silence)
-        self.log(f"Detected {len(silences)} silence interval(s).")
-
-        kept = self._invert_to_kept(duration, silences, margin=margin, min_clip_len=min_clip_len)
-        self.log(f"Keeping {len(kept)} non-silent interval(s).")
-        if not kept:
-            self.log("Nothing to keep (everything considered silence).")
-            return 1
-
-        # Build temp segments
-        tmpdir = Path(tempfile.mkdtemp(prefix="silencer_segments_"))
-        segments = []
-        durations = []
-        try:
-            for i, (a, b) in enumerate(kept):
-                self._check_cancelled()
-                if b is None:
-                    b = duration
-                if b <= a:
-                    continue
-                seg = tmpdir / f"seg_{i:04d}.mp4"
-                self._cut_segment(input_path, seg, a, b)
-                segments.append(seg)
-                durations.append(b - a)
-
-            if not segments:
-                self.log("No segments produced after filtering.")
-                return 1
-
-            if crossfade <= 0:
-                rc = self._concat_hard(segments, output_path)
-            else:
-                # Prevent enormous graphs from blowing up on extreme segment counts.
-                if len(segments) > 120:
-                    self.log(f"Too many segments ({len(segments)}). Falling back to hard cuts.")
-                    rc = self._concat_hard(segments, output_path)
-                else:
-                    rc = self._concat_crossfade(segments, durations, crossfade, output_path)
-
-            return rc
-        finally:
-            # Best-effort cleanup
-            try:
-                shutil.rmtree(tmpdir, ignore_errors=True)
-            except Exception:
-                pass
-
-
-# --------------------------
-# Helpers
-# --------------------------
-
-_number_re = re.compile(r"(\d+)")
-
-def natural_key(p: Path):
-    """
-    Numeric-aware sort: "2.mp4" comes before "10.mp4".
-    Works on the file's stem.
-    """
-    s = p.stem
-    parts = _number_re.split(s)
-    return [int(t) if t.isdigit() else t.lower() for t in parts]
-
-
-def add_autocut_suffix(p: Path) -> Path:
-    out = p.with_stem(p.stem + "_autocut")
-    if out.suffix.lower() not in (".mp4", ".mov", ".mkv", ".m4v"):
-        out = out.with_suffix(".mp4")
-    return out
-
-
-def is_video_file(p: Path) -> bool:
-    return p.suffix.lower() in VIDEO_EXTS
-
-
-# --------------------------
-# GUI
-# --------------------------
-
-class App(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title(APP_TITLE)
-        self.geometry("940x680")
-        self.minsize(860, 620)
-
-        self.settings = DEFAULTS.copy()
-
-        # Inputs
-        self.input_path = tk.StringVar()     # file or folder
-        self.output_path = tk.StringVar()    # single-file mode target
-        self.backend = tk.StringVar(value=self.settings["backend"])
-        self.threshold_db = tk.DoubleVar(value=self.settings["threshold_db"])
-        self.min_silence = tk.DoubleVar(value=self.settings["min_silence"])
-        self.margin = tk.DoubleVar(value=self.settings["margin"])
-        self.audio_track = tk.IntVar(value=self.settings["audio_track"])
-        self.min_clip_len = tk.DoubleVar(value=self.settings["min_clip_len"])
-        self.ffmpeg_path = tk.StringVar(value=self.settings["ffmpeg_path"])
-        self.open_in_shotcut = tk.BooleanVar(value=False)
-        self.shotcut_path = tk.StringVar(value="")
-        self.extract_frames = tk.BooleanVar(value=False)
-        self.frames_folder = tk.StringVar(value="")
-
-        self.threshold_db = tk.DoubleVar(value=self.settings["threshold_db"])
-        self.min_silence = tk.DoubleVar(value=self.settings["min_silence"])
-        self.margin = tk.DoubleVar(value=self.settings["margin"])
-        self.crossfade = tk.DoubleVar(value=self.settings["crossfade"]) # <--- NEW
-        self.audio_track = tk.IntVar(value=self.settings["audio_track"])
-        self.min_clip_len = tk.DoubleVar(value=self.settings["min_clip_len"])
-
-        self.running = False
-        self.worker_thread = None
-
-        self.stop_event = threading.Event()
-        self._active_proc = None
-
-        self._build_ui()
-        self._toggle_frames_controls()
-
-    def log(self, msg: str):
-        self.txt_log.insert(tk.END, msg + "\n")
-        self.txt_log.see(tk.END)
-        self.update_idletasks()
-
-
-    def _set_active_proc(self, proc):
-        """Store currently running subprocess for Stop button to terminate."""
-        self._active_proc = proc
-
-    def on_stop(self):
-        """Stop current operation (best-effort)."""
-        try:
-            self.stop_event.set()
-            proc = self._active_proc
-            if proc is not None:
-                try:
-                    proc.terminate()
-                except Exception:
-                    pass
-            self.log("⛔ Stop requested.")
-        except Exception:
-            pass
-
-    # ---------- Browsers ----------
-    def browse_input_file(self):
-        path = filedialog.askopenfilename(
-            title="Choose input video",
-            filetypes=[("Video files", ".mp4 .mov .mkv .avi .m4v .webm .wmv .flv"), ("All files", "*.*")]
-        )
-        if path:
-            self.input_path.set(path)
-            in_p = Path(path)
-            out = add_autocut_suffix(in_p)
-            self.output_path.set(str(out))
-
-    def browse_input_folder(self):
-        path = filedialog.askdirectory(title="Choose input folder (batch mode)")
-        if path:
-            self.input_path.set(path)
-            # In folder mode, we don't set output_path; each file gets its own, plus a final combined output.
-
-    def browse_output(self):
-        path = filedialog.asksaveasfilename(
-            title="Save output as", defaultextension=".mp4",
-            filetypes=[("MP4 video", ".mp4"), ("All files", "*.*")]
-        )
-        if path:
-            self.output_path.set(path)
-
-    def browse_ffmpeg(self):
-        path = filedialog.askopenfilename(title="Path to ffmpeg executable")
-        if path:
-            self.ffmpeg_path.set(path)
-
-    def browse_shotcut(self):
-        path = filedialog.askopenfilename(title="Path to Shotcut executable")
-        if path:
-            self.shotcut_path.set(path)
-
-    def browse_frames_folder(self):
-        path = filedialog.askdirectory(title="Choose folder for extracted frames")
-        if path:
-            self.frames_folder.set(path)
-
-    def _toggle_frames_controls(self):
-        enabled = self.extract_frames.get()
-        state = "normal" if enabled else "disabled"
-        try:
-            self.ent_frames_folder.configure(state=state)
-            self.btn_frames_browse.configure(state=state)
-        except Exception:
-            pass
-
-    def _toggle_shotcut_path(self):
-        enabled = self.open_in_shotcut.get()
-        state = "normal" if enabled else "disabled"
-        frm_open = self.winfo_children()[2]
-        entries = frm_open.winfo_children()
-        entries[1].configure(state=state)
-        entries[2].configure(state=state)
-
-    # ---------- UI ----------
-    def _build_ui(self):
-        pad = {"padx": 8, "pady": 6}
-
-        frm_top = ttk.LabelFrame(self, text="Input/Output")
-        frm_top.pack(fill=tk.X, **pad)
-        ttk.Label(frm_top, text="Input (file OR folder):").grid(row=0, column=0, sticky=tk.W)
-        ttk.Entry(frm_top, textvariable=self.input_path, width=72).grid(row=0, column=1, columnspan=2, sticky=tk.W)
-        ttk.Button(frm_top, text="Browse File", command=self.browse_input_file).grid(row=0, column=3)
-        ttk.Button(frm_top, text="Browse Folder", command=self.browse_input_folder).grid(row=0, column=4)
-
-        ttk.Label(frm_top, text="Output file (single-file mode):").grid(row=1, column=0, sticky=tk.W)
-        ttk.Entry(frm_top, textvariable=self.output_path, width=72).grid(row=1, column=1, columnspan=2, sticky=tk.W)
-        ttk.Button(frm_top, text="Browse", command=self.browse_output).grid(row=1, column=3)
-
-        # Frame extraction (optional)
-        ttk.Label(frm_top, text="Extract 1 in every 30 frames:").grid(row=2, column=0, sticky=tk.W)
-        ttk.Checkbutton(
-            frm_top,
-            text="Enable",
-            variable=self.extract_frames,
-            command=self._toggle_frames_controls
-        ).grid(row=2, column=1, sticky=tk.W)
-        self.ent_frames_folder = ttk.Entry(frm_top, textvariable=self.frames_folder, width=56, state="disabled")
-        self.ent_frames_folder.grid(row=2, column=2, columnspan=2, sticky=tk.W)
-        self.btn_frames_browse = ttk.Button(frm_top, text="Frames Folder", command=self.browse_frames_folder, state="disabled")
-        self.btn_frames_browse.grid(row=2, column=4)
-
-        ttk.Label(frm_top, text="Backend:").grid(row=3, column=0, sticky=tk.W)
-        ttk.Combobox(frm_top, textvariable=self.backend, values=["Auto-Editor", "FFmpeg"],
-                     state="readonly", width=18).grid(row=3, column=1, sticky=tk.W)
-
-        frm_params = ttk.LabelFrame(self, text="Parameters")
-        frm_params.pack(fill=tk.X, **pad)
-
-        # Row 0
-        ttk.Label(frm_params, text="Threshold (dBFS)").grid(row=0, column=0, sticky=tk.W)
-        ttk.Entry(frm_params, textvariable=self.threshold_db, width=10).grid(row=0, column=1)
-        ttk.Label(frm_params, text="Min silence (s)").grid(row=0, column=2, sticky=tk.W)
-        ttk.Entry(frm_params, textvariable=self.min_silence, width=10).grid(row=0, column=3)
-
-        # Row 1
-        ttk.Label(frm_params, text="Margin (s)").grid(row=1, column=0, sticky=tk.W)
-        ttk.Entry(frm_params, textvariable=self.margin, width=10).grid(row=1, column=1)
-        ttk.Label(frm_params, text="Crossfade (s)").grid(row=1, column=2, sticky=tk.W) # <--- NEW
-        ttk.Entry(frm_params, textvariable=self.crossfade, width=10).grid(row=1, column=3)
-
-        # Row 2
-        ttk.Label(frm_params, text="Min kept clip (s)").grid(row=2, column=0, sticky=tk.W)
-        ttk.Entry(frm_params, textvariable=self.min_clip_len, width=10).grid(row=2, column=1)
-        ttk.Label(frm_params, text="Audio track").grid(row=2, column=2, sticky=tk.W)
-        ttk.Entry(frm_params, textvariable=self.audio_track, width=10).grid(row=2, column=3)
-
-        # Row 3
-        ttk.Label(frm_params, text="FFmpeg path (opt)").grid(row=3, column=0, sticky=tk.W)
-        ttk.Entry(frm_params, textvariable=self.ffmpeg_path, width=38).grid(row=3, column=1, columnspan=3, sticky=tk.W)
-        ttk.Button(frm_params, text="Browse", command=self.browse_ffmpeg).grid(row=3, column=4, padx=4)
-
-        frm_open = ttk.Frame(self)
-        frm_open.pack(fill=tk.X, **pad)
-        ttk.Checkbutton(frm_open, text="Open output in Shotcut on finish",
-                        variable=self.open_in_shotcut,
-                        command=self._toggle_shotcut_path).pack(side=tk.LEFT)
-        ttk.Entry(frm_open, textvariable=self.shotcut_path, width=50, state="disabled").pack(side=tk.LEFT, padx=6)
-        ttk.Button(frm_open, text="Browse", command=self.browse_shotcut, state="disabled").pack(side=tk.LEFT)
-
-        frm_btns = ttk.Frame(self)
-        frm_btns.pack(fill=tk.X, **pad)
-        ttk.Button(frm_btns, text="Run", command=self.on_run).pack(side=tk.LEFT)
-        ttk.Button(frm_btns, text="Stop", command=self.on_stop).pack(side=tk.LEFT, padx=6)
-        ttk.Button(frm_btns, text="Install/Update Auto-Editor", command=self.install_autoeditor).pack(side=tk.LEFT)
-
-        frm_log = ttk.LabelFrame(self, text="Log")
-        frm_log.pack(fill=tk.BOTH, expand=True, **pad)
-        self.txt_log = tk.Text(frm_log, height=18, wrap="word")
-        self.txt_log.pack(fill=tk.BOTH, expand=True)
-
-    # ---------- Run / Workers ----------
-    def on_run(self):
-        if self.running:
-            messagebox.showinfo("Busy", "Already running.")
-            return
-
-        in_path = Path(self.input_path.get().strip())
-        if not in_path.exists():
-            messagebox.showerror("Missing input", "Please choose a valid input file or folder.")
-            return
-
-        # Validate single-file output path only in file mode
-        if in_path.is_file():
-            out_path = Path(self.output_path.get().strip()) if self.output_path.get().strip() else add_autocut_suffix(in_path)
-            if not out_path.parent.exists():
-                messagebox.showerror("Invalid output", f"Output folder doesn't exist: {out_path.parent}")
-                return
-
-        self.settings.update({
-            "backend": self.backend.get(),
-            "threshold_db": float(self.threshold_db.get()),
-            "min_silence": float(self.min_silence.get()),
-            "margin": float(self.margin.get()),
-            "crossfade": float(self.crossfade.get()),  # <--- NEW
-            "audio_track": int(self.audio_track.get()),
-            "min_clip_len": float(self.min_clip_len.get()),
-            "ffmpeg_path": self.ffmpeg_path.get().strip(),
-            "extract_frames": bool(self.extract_frames.get()),
-            "frames_folder": self.frames_folder.get().strip(),
-        })
-
-        self.running = True
-
-        self.stop_event.clear()
-        self.running = True
-        self.txt_log.delete("1.0", tk.END)
-        self.log("Starting...")
-
-        if in_path.is_dir():
-            self.worker_thread = threading.Thread(target=self._batch_worker, args=(in_path,), daemon=True)
-            self.worker_thread.start()
-        else:
-            self.worker_thread = threading.Thread(target=self._single_worker, args=(in_path,), daemon=True)
-            self.worker_thread.start()
-
-    def _make_backend(self):
-        if self.settings["backend"] == "Auto-Editor":
-            return AutoEditorBackend(self.settings, self.log, stop_event=self.stop_event, proc_setter=self._set_active_proc)
-        return FFmpegBackend(self.settings, self.log, stop_event=self.stop_event, proc_setter=self._set_active_proc)
-
-    def _single_worker(self, in_path: Path):
-        try:
-            start = time.time()
-            out_path = Path(self.output_path.get().strip()) if self.output_path.get().strip() else add_autocut_suffix(in_path)
-            backend = self._make_backend()
-            rc = backend.run(in_path, out_path)
-            dur = time.time() - start
-            if rc == 0:
-                self.log(f"\n✅ Done in {dur:.1f}s → {out_path}")
-                self.play_done_sound()
-                if self.settings.get("extract_frames"):
-                    frames_root = self._resolve_frames_root(in_path, out_path)
-                    self._extract_sampled_frames(out_path, frames_root, interval=FRAME_EXTRACT_INTERVAL)
-                self.open_in_shotcut_if_requested(out_path)
-            else:
-                self.log(f"\n❌ FAILED with exit code {rc}")
-        finally:
-            self.running = False
-
-    def _batch_worker(self, folder: Path):
-        start = time.time()
-        try:
-            self.log(f"Batch mode: scanning folder → {folder}")
-            files = [p for p in folder.iterdir() if p.is_file() and is_video_file(p)]
-            files = [p for p in files if "_autocut" not in p.stem.lower()]
-
-            if not files:
-                self.log("No input videos found (or they all look already processed).")
-                return
-
-            files.sort(key=natural_key)
-            total = len(files)
-            self.log(f"Found {total} video(s) to process.")
-
-            backend = self._make_backend()
-
-            for idx, src in enumerate(files, 1):
-                out_path = add_autocut_suffix(src)
-                self.log(f"\n[{idx}/{total}] Processing: {src.name}")
-                rc = backend.run(src, out_path)
-                if rc == 0 and out_path.exists():
-                    self.log(f"✅ Wrote {out_path.name}")
-                    # Always apply fade to each output file
-                    final_vid = self._fade_output(out_path)
-                    if self.settings.get("extract_frames") and Path(final_vid).exists():
-                        frames_root = self._resolve_frames_root(folder, Path(final_vid))
-                        self._extract_sampled_frames(Path(final_vid), frames_root, interval=FRAME_EXTRACT_INTERVAL)
-                else:
-                    self.log(f"❌ FAILED on {src.name} (exit {rc}) — continuing")
-
-            self.log("\n🎬 All videos processed individually (no megacut).")
-            dur = time.time() - start
-            self.log(f"\nBatch complete in {dur:.1f}s.")
-            self.play_done_sound()
-
-        finally:
-            self.running = False
-
-    def _resolve_frames_root(self, in_path: Path, out_video: Path) -> Path:
-        """Pick the root folder where per-video frame folders will be created."""
-        root = (self.settings.get("frames_folder") or "").strip()
-        if root:
-            return Path(root)
-        # Default roots:
-        if in_path.is_dir():
-            # batch mode default: <input_folder>/<input_folder_name>_frames
-            return in_path / f"{in_path.name}_frames"
-        # single mode default: <output_parent>/<output_stem>_frames
-        return out_video.parent / f"{out_video.stem}_frames"
-
-    def _extract_sampled_frames(self, video: Path, frames_root: Path, interval: int = FRAME_EXTRACT_INTERVAL) -> int:
-        """Extract 1 out of every `interval` frames to frames_root/<video_stem>/frame_XXXXXX.png."""
-        frames_root.mkdir(parents=True, exist_ok=True)
-        out_dir = frames_root / video.stem
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        ff = FFmpegBackend(self.settings, self.log).get_ffmpeg()
-
-        # FFmpeg filter: select frames where n % interval == 0
-        # Comma must be escaped for FFmpeg expression parsing.
-        vf = f"select=not(mod(n\\,{interval}))"
-
-        out_pattern = str(out_dir / "frame_%06d.png")
-        cmd = [
-            ff, "-hide_banner", "-y",
-            "-i", str(video),
-            "-vf", vf,
-            "-vsync", "vfr",
-            out_pattern,
-        ]
-        self.log(f"🖼 Extracting frames (1/{interval}) → {out_dir}")
-        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-        if rc == 0:
-            self.log(f"✅ Frames written to: {out_dir}")
-        else:
-            self.log(f"⚠ Frame extraction failed (exit {rc}) for: {video.name}")
-        return rc
-
-    def _get_duration(self, video: Path) -> float:
-        """Return duration (seconds) using ffprobe (no window)."""
-        backend = FFmpegBackend(self.settings, self.log, stop_event=self.stop_event, proc_setter=self._set_active_proc)
-        ffprobe = backend.get_ffprobe()
-        cmd = [ffprobe, "-v", "error", "-show_entries",
-               "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", str(video)]
-        creationflags = 0
-        if os.name == "nt":
-            creationflags = subprocess.CREATE_NO_WINDOW
-        try:
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                    text=True, encoding="utf-8", errors="replace",
-                                    creationflags=creationflags)
-            return float((result.stdout or "").strip() or 0.0)
-        except Exception:
-            return 0.0
-
-    def _fade_output(self, video: Path):
-        """Apply fade-to-black to the end of a video safely."""
-        ff = FFmpegBackend(self.settings, self.log).get_ffmpeg()
-        dur = self._get_duration(video)
-        if dur <= 0:
-            self.log(f"⚠ Unable to determine duration for fade: {video}")
-            return video
-
-        # Create a temp output next to original
-        temp_out = video.with_name(video.stem + "_fade.mp4")
-        fade_filter = f"fade=t=out:st={max(dur-2,0):.2f}:d=2"
-
-        cmd = [
-            ff, "-hide_banner", "-y",
-            "-i", str(video),
-            "-vf", fade_filter,
-            "-c:a", "copy",
-            str(temp_out)
-        ]
-        self.log("Applying fade (safe mode): " + " ".join(cmd))
-        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-        if rc == 0 and temp_out.exists():
-            try:
-                video.unlink(missing_ok=True)
-                temp_out.rename(video)
-                self.log(f"✅ Fade applied to {video.name}")
-                return video
-            except Exception as e:
-                self.log(f"⚠ Fade succeeded but rename failed: {e}")
-                return temp_out
-        else:
-            self.log("⚠ Fade failed, keeping original.")
-            return video
-
-    def _concat_outputs(self, outputs: list[Path], final_path: Path) -> int:
-        """
-        Concatenate, apply fade to black to each clip before concat, then
-        split output if > 8 hours (28800s)
-        """
-        # ✅ No per-clip fades anymore
-        faded = outputs[:]  # just pass them along unchanged
-
-        ff = FFmpegBackend(self.settings, self.log).get_ffmpeg()
-        with tempfile.TemporaryDirectory() as td:
-            list_file = Path(td) / "concat.txt"
-            with list_file.open("w", encoding="utf-8") as f:
-                for p in faded:
-                    safe_p = str(p).replace("'", "\\'")
-                    f.write(f"file '{safe_p}'\n")
-
-            cmd = [
-                ff, "-hide_banner", "-y",
-                "-f", "concat", "-safe", "0",
-                "-i", str(list_file),
-                "-c", "copy",
-                str(final_path)
-            ]
-
-            self.log("Combining with: " + " ".join(cmd))
-            rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-            if rc != 0:
-                return rc
-            # ✅ Apply single fade at the very end
-            self._fade_output(final_path)
-
-        # Check final duration
-        dur = self._get_duration(final_path)
-        self.log(f"Combined duration: {dur/3600:.2f} hours")
-
-        if dur > 28800:  # 8 hours
-            self.log("Splitting into PART 1 and PART 2")
-
-            part1 = final_path.with_name(final_path.stem + "_PART1.mp4")
-            part2 = final_path.with_name(final_path.stem + "_PART2.mp4")
-
-            # Split evenly
-            half = dur / 2
-            split_cmds = [
-                [ff, "-y", "-i", str(final_path), "-t", str(half), "-c", "copy", str(part1)],
-                [ff, "-y", "-i", str(final_path), "-ss", str(half), "-c", "copy", str(part2)]
-            ]
-            for cmd in split_cmds:
-                self.log("Splitting: " + " ".join(cmd))
-                run_subprocess(cmd, self.log)
-
-            final_path.unlink()  # remove the giant original
-            self.log(f"✅ Created split files:\n{part1}\n{part2}")
-
-        return 0
-
-    # ---------- Misc ----------
-    def on_stop(self):
-        messagebox.showinfo("Stop", "Close the app to stop the process (safe stop coming soon).")
-
-    def open_in_shotcut_if_requested(self, output_path: Path):
-        if not self.open_in_shotcut.get():
-            return
-        exe = self.shotcut_path.get().strip() or which("shotcut") or which("shotcut.exe")
-        if not exe:
-            self.log("Shotcut not found. Set its path to auto-open.")
-            return
-        subprocess.Popen([exe, str(output_path)])
-        self.log("Opened in Shotcut.")
-
-    def install_autoeditor(self):
-        self.log("Installing Auto-Editor via pip...")
-        cmd = [sys.executable, "-m", "pip", "install", "--upgrade", "auto-editor"]
-        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
-        if rc == 0:
-            self.log("Auto-Editor installed or updated successfully.")
-        else:
-            self.log("Failed to install Auto-Editor.")
-            
-    def play_done_sound(self):
-        try:
-            winsound.PlaySound(
-                r"CHANGETOYOURDIRECTORY.mp4",
-                winsound.SND_FILENAME | winsound.SND_ASYNC
-            )
-        except Exception as e:
-            self.log(f"⚠ Could not play sound: {e}")
-
-
-
-def main():
-    app = App()
-    app.mainloop()
-
-
-if __name__ == "__main__":
-    main()
-
+import os
+import sys
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import shutil
+import json
+import queue
+import time
+import functools
+import itertools
+import collections
+from types import MappingProxyType
+from pathlib import Path
+import re
+import tempfile
+import tkinter as tk
+from tkinter import ttk
+
+# filedialog/messagebox are imported lazily where used: they're only needed
+# once the user clicks something, and their import is slow on Windows.
+
+if os.name == "nt":
+    import winsound
+else:
+    winsound = None
+
+try:
+    import numpy as np
+except ImportError:  # optional; the pure-Python interval math still works
+    np = None
+
+try:
+    import cv2
+except ImportError:  # optional; frame sampling falls back to FFmpeg
+    cv2 = None
+
+try:
+    import av
+except ImportError:  # optional; durations fall back to spawning ffprobe
+    av = None
+
+"""
+Shotcut Auto-Cut GUI (Tkinter)
+--------------------------------
+This GUI lets you automatically cut out low-volume (silent) parts of videos.
+It supports two backends:
+
+1. Auto-Editor (recommended)
+   - https://auto-editor.com
+   - Detects and removes silence intelligently.
+   - Allows margins and smart clip detection.
+
+2. FFmpeg “silenceremove” (simple fallback)
+   - Requires ffmpeg in PATH.
+   - Removes low-volume parts directly from audio stream.
+
+New in this version:
+- Folder (batch) mode: process all videos in a folder (non-recursive)
+- Skips files that already contain "_autocut" in the name
+- After batch, builds <foldername>_ALL_autocut.mp4 by concatenating outputs in numeric order
+"""
+
+APP_TITLE = "Shotcut Auto-Cut GUI (Silence/Low-Volume)"
+
+# Frame extraction: save 1 out of every N frames (N=30 by default)
+FRAME_EXTRACT_INTERVAL = 30
+
+# Frozen so a stray settings mutation can't corrupt the defaults
+DEFAULTS = MappingProxyType({
+    "backend": "Auto-Editor",
+    "threshold_db": -30.0,
+    "min_silence": 1.35,
+    "margin": 0.5,
+    "crossfade": 0.0,    # <--- NEW
+    "audio_track": 0,
+    "min_clip_len": 0.58,
+    "ffmpeg_path": "",
+    "extract_frames": False,
+    "frames_folder": "",
+    "hw_encode": True,
+    "frame_format": "jpg",   # "jpg" or "png"; jpg encodes several times faster
+    "apply_fade": True,
+    "parallel_jobs": min(4, max(1, (os.cpu_count() or 4) // 2)),
+})
+VIDEO_EXTS = frozenset({".mp4", ".mov", ".mkv", ".avi", ".m4v", ".webm", ".wmv", ".flv"})
+
+# Shared encoder parameters for every re-encode. Profile/level and audio
+# rate/channels are pinned so all outputs are stream-copy compatible and the
+# final batch concat can always take the demuxer's -c copy path.
+ENCODE_ARGS = [
+    "-c:v", "libx264", "-crf", "18", "-preset", "veryfast",
+    "-pix_fmt", "yuv420p", "-profile:v", "high", "-level", "4.1",
+    "-c:a", "aac", "-b:a", "192k", "-ar", "48000", "-ac", "2",
+]
+
+# silencedetect events as written by ametadata=mode=print, precompiled once;
+# one combined pattern so each line costs a single search
+_SIL_RE = re.compile(r"lavfi\.silence_(start|end)=([0-9.]+)")
+
+
+def which(program: str):
+    """Cross-platform which wrapper."""
+    return shutil.which(program)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_duration(ffprobe: str, path_str: str, mtime_ns: int) -> float:
+    """
+    Probe a file's duration once per (path, mtime); repeat calls are free.
+
+    With PyAV installed the container is opened in-process (no ~50-150ms
+    process spawn per probe — noticeable across a big batch); otherwise an
+    ffprobe subprocess is used.
+    """
+    if av is not None:
+        try:
+            with av.open(path_str) as container:
+                if container.duration is not None:
+                    return container.duration / av.time_base
+        except Exception:
+            pass  # unreadable via PyAV; let ffprobe have a go
+    cmd = [
+        ffprobe, "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        path_str
+    ]
+    creationflags = 0
+    if os.name == "nt":
+        creationflags = subprocess.CREATE_NO_WINDOW
+    try:
+        # Only a single float comes back on stdout: read it as bytes and
+        # send stderr/stdin to DEVNULL — no text wrapper, no PIPE to deadlock
+        # on for chatty ffprobe builds.
+        r = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                           stdin=subprocess.DEVNULL, creationflags=creationflags)
+        return float(r.stdout.strip() or b"0")
+    except Exception:
+        return 0.0
+
+
+def run_subprocess(cmd_list, log_callback, cwd=None, *, stop_event=None, proc_setter=None):
+    """
+    Run a subprocess and stream stdout/stderr to log_callback.
+
+    Output is read as raw bytes in 64KB chunks on a dedicated reader thread
+    and decoded/split here, so the worker isn't doing a per-line
+    ReadFile+decode and cancellation latency is bounded by the queue poll
+    (~50ms) instead of "whenever ffmpeg prints its next line".
+
+    - log_callback: callable(str) or None. None discards the output at the
+      OS level (DEVNULL) and runs without a reader thread at all — use it
+      when the output is known to be noise. Concurrent batch jobs that
+      don't log therefore cost one process each, not one process plus one
+      drain thread.
+    - stop_event: threading.Event (optional). If set, the process will be terminated.
+    - proc_setter: callable(proc|None) (optional). Lets the GUI store the active Popen handle.
+    """
+    creationflags = 0
+    startupinfo = None
+    if os.name == "nt":
+        # Prevent flashing console windows on Windows
+        creationflags = subprocess.CREATE_NO_WINDOW
+
+    try:
+        proc = subprocess.Popen(
+            cmd_list,
+            stdout=subprocess.PIPE if log_callback is not None else subprocess.DEVNULL,
+            stderr=subprocess.STDOUT,
+            cwd=cwd,
+            bufsize=0,  # raw pipe: reader thread is a plain os.read loop
+            creationflags=creationflags,
+            startupinfo=startupinfo,
+        )
+        if proc_setter:
+            try:
+                proc_setter(proc)
+            except Exception:
+                pass
+
+        if log_callback is None:
+            # No output to drain: just wait, polling so stop stays responsive.
+            while True:
+                if stop_event is not None and stop_event.is_set():
+                    try:
+                        proc.terminate()
+                    except Exception:
+                        pass
+                    try:
+                        proc.wait(timeout=2)
+                    except subprocess.TimeoutExpired:
+                        try:
+                            proc.kill()
+                        except Exception:
+                            pass
+                    break
+                try:
+                    proc.wait(timeout=0.05)
+                    break
+                except subprocess.TimeoutExpired:
+                    continue
+            proc.wait()
+            return proc.returncode
+
+        chunks = queue.Queue()
+
+        def _reader(stream):
+            try:
+                while True:
+                    chunk = stream.read(65536)
+                    if not chunk:
+                        break
+                    chunks.put(chunk)
+            except Exception:
+                pass
+            finally:
+                chunks.put(None)  # EOF sentinel
+
+        threading.Thread(target=_reader, args=(proc.stdout,), daemon=True).start()
+
+        pending = ""
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                # Staged shutdown: terminate, give it a moment, then kill.
+                try:
+                    proc.terminate()
+                except Exception:
+                    pass
+                try:
+                    proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    try:
+                        proc.kill()
+                    except Exception:
+                        pass
+                break
+            try:
+                chunk = chunks.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if chunk is None:
+                break
+            # ffmpeg progress lines use bare \r; treat them as line breaks too
+            pending += chunk.decode("utf-8", "replace").replace("\r", "\n")
+            lines = pending.split("\n")
+            pending = lines.pop()
+            for line in lines:
+                if line:
+                    log_callback(line)
+        if pending:
+            log_callback(pending)
+
+        # Bounded reap: an ffmpeg stuck in a flush must not hang us forever.
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+            proc.wait()
+        return proc.returncode
+    except FileNotFoundError as e:
+        if log_callback is not None:
+            log_callback(f"ERROR: {e}")
+        return 127
+    except Exception as e:
+        if log_callback is not None:
+            log_callback(f"ERROR running subprocess: {e}")
+        return 1
+    finally:
+        if proc_setter:
+            try:
+                proc_setter(None)
+            except Exception:
+                pass
+
+
+# --------------------------
+# Auto-Editor backend
+# --------------------------
+
+class AutoEditorBackend:
+    """Wrapper for Auto-Editor CLI (new v24+ syntax)"""
+
+    def __init__(self, settings, log, stop_event=None, proc_setter=None):
+        self.settings = settings
+        self.log = log
+        self.stop_event = stop_event
+        self.proc_setter = proc_setter
+
+    def ensure_installed(self) -> bool:
+        exe = which("auto-editor")
+        if exe:
+            self.log(f"Found auto-editor at: {exe}")
+            return True
+        self.log("auto-editor not found. Attempting installation via pip...")
+        cmd = [sys.executable, "-m", "pip", "install", "--upgrade", "auto-editor"]
+        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
+        if rc == 0 and which("auto-editor"):
+            self.log("auto-editor installed successfully.")
+            return True
+        self.log("ERROR: Unable to install or locate auto-editor.")
+        return False
+
+    def build_cmd(self, input_path: Path, output_path: Path):
+        s = self.settings
+
+        # Gather settings
+        threshold_db = float(s["threshold_db"])
+        margin = float(s["margin"])
+        crossfade = float(s.get("crossfade", 0.0))
+
+        edit_arg = f"audio:threshold={threshold_db}dB"
+
+        cmd = [
+            "auto-editor",
+            str(input_path),
+            "--edit", edit_arg,
+            "--margin", f"{margin}sec",
+            "--output", str(output_path),
+            "--no_open"
+        ]
+
+        # Add crossfade if requested
+        if crossfade > 0:
+            cmd.extend(["--add-transition", f"fade:{crossfade}sec"])
+
+        return cmd
+
+    def run(self, input_path: Path, output_path: Path):
+        if not self.ensure_installed():
+            return 1
+
+        cmd = self.build_cmd(input_path, output_path)
+        self.log("Running: " + " ".join(cmd))
+        return run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
+
+# --------------------------
+# FFmpeg backend
+# --------------------------
+
+class FFmpegBackend:
+    """
+    FFmpeg backend with real crossfade support.
+
+    Pipeline:
+      1) Detect silence with silencedetect
+      2) Convert silence intervals -> kept intervals (non-silent), applying margin and min_clip_len
+      3) Cut + join in a single ffmpeg pass via trim/atrim labels:
+          - crossfade == 0: concat filter node (hard cuts)
+          - crossfade  > 0: xfade + acrossfade chain (true A/V crossfades)
+         Very large interval counts are chunked (Windows has a ~64KB arg
+         limit) and the chunk outputs joined with the concat demuxer.
+    """
+
+    # How many trim intervals fit comfortably in one filter_complex arg.
+    MAX_FILTER_INTERVALS = 80
+
+    def __init__(self, settings, log, stop_event=None, proc_setter=None):
+        self.settings = settings
+        self.log = log
+        self.stop_event = stop_event
+        self.proc_setter = proc_setter
+        # Set by the GUI to fuse 1-in-N frame extraction into the cut pass.
+        self.frames_dir = None
+        self.frames_written = False
+        # Resolved executables don't change mid-run; look them up once.
+        self._ffmpeg_cached = None
+        self._ffprobe_cached = None
+
+    def get_ffmpeg(self) -> str:
+        if self._ffmpeg_cached:
+            return self._ffmpeg_cached
+        user_path = (self.settings.get("ffmpeg_path", "") or "").strip()
+        if user_path:
+            exe = user_path
+        else:
+            exe = which("ffmpeg") or "ffmpeg"
+        self._ffmpeg_cached = exe
+        return exe
+
+    def get_ffprobe(self) -> str:
+        if self._ffprobe_cached:
+            return self._ffprobe_cached
+        self._ffprobe_cached = self._resolve_ffprobe()
+        return self._ffprobe_cached
+
+    def _resolve_ffprobe(self) -> str:
+        ffmpeg = self.get_ffmpeg()
+        try:
+            p = Path(ffmpeg)
+            # If user provided an absolute path, prefer sibling ffprobe(.exe)
+            if p.suffix.lower() == ".exe" or p.name.lower().startswith("ffmpeg"):
+                cand = p.with_name("ffprobe.exe" if p.suffix.lower() == ".exe" else "ffprobe")
+                if cand.exists():
+                    return str(cand)
+        except Exception:
+            pass
+        exe = which("ffprobe")
+        if exe:
+            return exe
+        return "ffprobe"
+
+    def _check_cancelled(self):
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise RuntimeError("Cancelled by user.")
+
+    def _probe_duration(self, video: Path) -> float:
+        try:
+            mtime_ns = video.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        return _cached_duration(self.get_ffprobe(), str(video), mtime_ns)
+
+    def _detect_silence(self, input_path: Path, threshold_db: float, min_silence: float):
+        """
+        Returns a list of (silence_start, silence_end) in seconds.
+        silence_end may be None if silence runs to EOF (we'll fix up using duration).
+
+        silencedetect events go to a small metadata file via
+        ametadata=mode=print instead of being scraped out of ffmpeg's
+        human-readable stderr, so Python never touches the log stream.
+        """
+        ffmpeg = self.get_ffmpeg()
+        fd, meta_name = tempfile.mkstemp(prefix="silencer_meta_", suffix=".txt")
+        os.close(fd)
+        try:
+            # Escape for filter-option parsing (Windows drive colons, backslashes)
+            meta_escaped = meta_name.replace("\\", "/").replace(":", "\\:")
+            # Audio only, downmixed to 16kHz mono *before* the detector:
+            # -ac/-ar are output options that ffmpeg applies after -af, so
+            # the conversion must sit in the filter chain itself for
+            # silencedetect to see the reduced stream. It's making a level
+            # decision, so skipping video demux and ~6x of the samples
+            # changes nothing about the result.
+            cmd = [
+                ffmpeg, "-hide_banner", "-nostats", "-loglevel", "error",
+                "-vn", "-i", str(input_path),
+                "-af", (f"aformat=channel_layouts=mono:sample_rates=16000,"
+                        f"silencedetect=noise={threshold_db}dB:d={min_silence},"
+                        f"ametadata=mode=print:file={meta_escaped}"),
+                "-f", "null", "-"
+            ]
+            self.log("Detecting silence via FFmpeg silencedetect...")
+            rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
+            if rc != 0:
+                raise RuntimeError(f"FFmpeg silencedetect failed (exit {rc}).")
+
+            silences = []
+            start = None
+            with open(meta_name, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    m = _SIL_RE.search(line)
+                    if not m:
+                        continue
+                    if m.group(1) == "start":
+                        start = float(m.group(2))
+                    elif start is not None:
+                        silences.append((start, float(m.group(2))))
+                        start = None
+
+            if start is not None:
+                silences.append((start, None))
+
+            return silences
+        finally:
+            try:
+                os.unlink(meta_name)
+            except OSError:
+                pass
+
+    def _invert_to_kept(self, duration: float, silences, margin: float, min_clip_len: float):
+        """
+        Convert silence intervals -> kept (non-silent) intervals.
+        Apply margin by expanding each silence interval by +/- margin.
+        """
+        if duration <= 0:
+            # best-effort
+            return [(0.0, None)]
+
+        # Vectorize for big interval counts; ndarray overhead isn't worth it
+        # for the typical handful.
+        if np is not None and len(silences) > 16:
+            return self._invert_to_kept_np(duration, silences, margin, min_clip_len)
+        return self._invert_to_kept_py(duration, silences, margin, min_clip_len)
+
+    def _invert_to_kept_np(self, duration: float, silences, margin: float, min_clip_len: float):
+        """NumPy version of the expand/merge/invert interval math."""
+        arr = np.asarray(
+            [(s0, duration if s1 is None else s1) for s0, s1 in silences],
+            dtype=np.float64,
+        )
+        a = np.maximum(0.0, arr[:, 0] - margin)
+        b = np.minimum(duration, arr[:, 1] + margin)
+
+        order = np.argsort(a, kind="stable")
+        a = a[order]
+        b = b[order]
+
+        # Merge: a silence starts a new merged block where it begins after
+        # the running max of all previous ends.
+        running_end = np.maximum.accumulate(b)
+        is_new = np.empty(len(a), dtype=bool)
+        is_new[0] = True
+        is_new[1:] = a[1:] > running_end[:-1]
+        merged_starts = a[is_new]
+        merged_ends = np.maximum.reduceat(b, np.flatnonzero(is_new))
+
+        # Invert: kept intervals are the gaps between merged silences.
+        gap_starts = np.concatenate(([0.0], merged_ends))
+        gap_ends = np.concatenate((merged_starts, [duration]))
+        mask = (gap_ends - gap_starts) >= min_clip_len
+        return [(float(x), float(y)) for x, y in zip(gap_starts[mask], gap_ends[mask])]
+
+    def _invert_to_kept_py(self, duration: float, silences, margin: float, min_clip_len: float):
+        # Expand silence intervals by margin, then clamp
+        expanded = []
+        for s0, s1 in silences:
+            a = max(0.0, float(s0) - margin)
+            b = None if s1 is None else min(duration, float(s1) + margin)
+            expanded.append((a, b))
+
+        # Merge overlapping expanded silences
+        expanded.sort(key=lambda x: x[0])
+        merged = []
+        for a, b in expanded:
+            if not merged:
+                merged.append([a, b])
+                continue
+            pa, pb = merged[-1]
+            pb_val = duration if pb is None else pb
+            b_val = duration if b is None else b
+            if a <= pb_val:
+                # overlap/adjacent
+                merged[-1][1] = None if (pb is None or b is None) else max(pb, b)
+            else:
+                merged.append([a, b])
+
+        # Invert
+        kept = []
+        cur = 0.0
+        for a, b in merged:
+            end_a = a
+            if end_a - cur >= min_clip_len:
+                kept.append((cur, end_a))
+            cur = duration if b is None else b
+        if duration - cur >= min_clip_len:
+            kept.append((cur, duration))
+
+        return kept
+
+    def _build_trim_filter(self, kept):
+        """
+        Build filter_complex lines that trim each kept interval out of the
+        single input, labelled [v0]/[a0], [v1]/[a1], ...
+        """
+        fc_lines = []
+        for i, (a, b) in enumerate(kept):
+            fc_lines.append(f"[0:v]trim=start={a:.6f}:end={b:.6f},setpts=PTS-STARTPTS[v{i}]")
+            fc_lines.append(f"[0:a]atrim=start={a:.6f}:end={b:.6f},asetpts=PTS-STARTPTS[a{i}]")
+        return fc_lines
+
+    def _fuse_frames_branch(self, fc_lines, v_label):
+        """
+        Split the final video label into the main output plus a 1-in-N
+        thumbnail branch, so frame extraction reuses the frames this pass
+        already decoded instead of spawning a second ffmpeg.
+
+        Returns (main_video_label, extra_output_args).
+        """
+        if self.frames_dir is None:
+            return v_label, []
+        self.frames_dir.mkdir(parents=True, exist_ok=True)
+        fc_lines.append(f"{v_label}split=2[vfinal][vthumb]")
+        fc_lines.append(
+            f"[vthumb]select='not(mod(n\\,{FRAME_EXTRACT_INTERVAL}))',setpts=N/FRAME_RATE/TB[frames]"
+        )
+        fmt = self.settings.get("frame_format", "jpg")
+        extra = ["-map", "[frames]", "-vsync", "vfr"]
+        if fmt == "jpg":
+            extra += ["-q:v", "3"]
+        extra.append(str(self.frames_dir / f"frame_%06d.{fmt}"))
+        self.frames_written = True
+        return "[vfinal]", extra
+
+    def _cut_concat_single_pass(self, input_path: Path, output_path: Path, kept, fuse_frames=True):
+        """
+        Cut all kept intervals and join them (hard cuts) in ONE ffmpeg run:
+        trim/atrim per interval + a concat filter node. One decode, one encode,
+        no temp segment files.
+        """
+        self._check_cancelled()
+        ffmpeg = self.get_ffmpeg()
+        n = len(kept)
+
+        fc_lines = self._build_trim_filter(kept)
+        pads = "".join(f"[v{i}][a{i}]" for i in range(n))
+        fc_lines.append(f"{pads}concat=n={n}:v=1:a=1[vout][aout]")
+
+        v_map, extra_out = ("[vout]", [])
+        if fuse_frames:
+            v_map, extra_out = self._fuse_frames_branch(fc_lines, "[vout]")
+
+        cmd = [
+            ffmpeg, "-hide_banner", "-y",
+            "-i", str(input_path),
+            "-filter_complex", ";".join(fc_lines),
+            "-map", v_map, "-map", "[aout]",
+            *ENCODE_ARGS,
+            str(output_path)
+        ] + extra_out
+        self.log(f"Cutting {n} interval(s) in a single pass...")
+        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
+        if rc != 0:
+            raise RuntimeError(f"FFmpeg single-pass cut failed (exit {rc}).")
+
+    def _concat_hard(self, segments, output_path: Path):
+        self._check_cancelled()
+        ffmpeg = self.get_ffmpeg()
+        list_file = output_path.with_suffix(".concat.txt")
+        with list_file.open("w", encoding="utf-8") as f:
+            for seg in segments:
+                # concat demuxer needs: file 'path'
+                path_str = str(seg).replace("'", "'\\''")
+                f.write("file '" + path_str + "'\n")
+
+        cmd = [
+            ffmpeg, "-hide_banner", "-y",
+            "-f", "concat", "-safe", "0",
+            "-i", str(list_file),
+            "-c", "copy",
+            str(output_path)
+        ]
+        self.log("Concatenating (hard cuts)...")
+        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
+        if rc != 0:
+            # Fallback: re-encode concat (more compatible)
+            self.log("Hard concat with -c copy failed; retrying with re-encode...")
+            cmd = [
+                ffmpeg, "-hide_banner", "-y",
+                "-f", "concat", "-safe", "0",
+                "-i", str(list_file),
+                *ENCODE_ARGS,
+                str(output_path)
+            ]
+            rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
+        try:
+            list_file.unlink(missing_ok=True)
+        except Exception:
+            pass
+        return rc
+
+    def _crossfade_tree(self, fc_lines, durations, crossfade: float, n: int):
+        """
+        Combine trimmed labels pairwise generation by generation and return
+        the final (video_label, audio_label).
+        """
+        nodes = [(f"[v{i}]", f"[a{i}]", durations[i]) for i in range(n)]
+        gen = 0
+        while len(nodes) > 1:
+            merged = []
+            for j in range(0, len(nodes) - 1, 2):
+                v1, a1, d1 = nodes[j]
+                v2, a2, d2 = nodes[j + 1]
+                out_v = f"[tv{gen}_{j // 2}]"
+                out_a = f"[ta{gen}_{j // 2}]"
+                offset = max(0.0, d1 - crossfade)
+                fc_lines.append(f"{v1}{v2}xfade=transition=fade:duration={crossfade}:offset={offset}{out_v}")
+                fc_lines.append(f"{a1}{a2}acrossfade=d={crossfade}{out_a}")
+                merged.append((out_v, out_a, d1 + d2 - crossfade))
+            if len(nodes) % 2:
+                merged.append(nodes[-1])
+            nodes = merged
+            gen += 1
+        return nodes[0][0], nodes[0][1]
+
+    def _concat_crossfade(self, input_path: Path, kept, durations, crossfade: float, output_path: Path):
+        """
+        Cut + crossfade in ONE ffmpeg run: trim labels feed a chained
+        xfade/acrossfade graph, so segments never hit disk.
+        """
+        self._check_cancelled()
+        ffmpeg = self.get_ffmpeg()
+        n = len(kept)
+
+        fc_lines = self._build_trim_filter(kept)
+
+        if n > 10:
+            # Pairwise tree instead of a length-N chain: depth log2(N), so
+            # ffmpeg's per-stream buffering grows O(log N) instead of O(N).
+            v_label, a_label = self._crossfade_tree(fc_lines, durations, crossfade, n)
+        else:
+            # Chained xfade with all offsets precomputed up front:
+            # offset_i = sum(d_0..d_{i-1}) - i*crossfade
+            if np is not None:
+                offsets = np.maximum(0.0, np.cumsum(durations)[:-1] - crossfade * np.arange(1, n))
+            else:
+                acc = list(itertools.accumulate(durations))
+                offsets = [max(0.0, acc[i - 1] - crossfade * i) for i in range(1, n)]
+            v_labels = ["[v0]"] + [f"[xv{i}]" for i in range(1, n)]
+            a_labels = ["[a0]"] + [f"[xa{i}]" for i in range(1, n)]
+            fc_lines.extend(
+                f"{v_labels[i - 1]}[v{i}]xfade=transition=fade:duration={crossfade}:offset={offsets[i - 1]}{v_labels[i]}"
+                for i in range(1, n)
+            )
+            fc_lines.extend(
+                f"{a_labels[i - 1]}[a{i}]acrossfade=d={crossfade}{a_labels[i]}"
+                for i in range(1, n)
+            )
+            v_label, a_label = v_labels[-1], a_labels[-1]
+
+        v_label, extra_out = self._fuse_frames_branch(fc_lines, v_label)
+
+        filter_complex = ";".join(fc_lines)
+
+        cmd = [
+            ffmpeg, "-hide_banner", "-y",
+            "-i", str(input_path),
+            "-filter_complex", filter_complex,
+            "-map", v_label,
+            "-map", a_label,
+            *ENCODE_ARGS,
+            str(output_path)
+        ] + extra_out
+
+        self.log("Cutting + crossfading in a single pass...")
+        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
+        return rc
+
+    def run(self, input_path: Path, output_path: Path):
+        """
+        Cut the silences out of input_path into output_path.
+
+        Post-condition: a return of 0 means output_path exists and is
+        complete — ffmpeg only exits 0 after finalizing its output, and the
+        stream-copy fast path renames into place. Callers don't need an
+        exists() check of their own on success.
+        """
+        s = self.settings
+        threshold_db = float(s["threshold_db"])
+        min_silence = float(s["min_silence"])
+        margin = float(s.get("margin", 0.0))
+        crossfade = float(s.get("crossfade", 0.0))
+        min_clip_len = float(s.get("min_clip_len", 0.0))
+
+        # If user asks for crossfade but margin/min_clip_len are zero-ish, still do it.
+        duration = self._probe_duration(input_path)
+        self.log(f"Duration: {duration:.2f}s")
+
+        silences = self._detect_silence(input_path, threshold_db=threshold_db, min_silence=min_silence)
+        self.log(f"Detected {len(silences)} silence interval(s).")
+
+        kept = self._invert_to_kept(duration, silences, margin=margin, min_clip_len=min_clip_len)
+        self.log(f"Keeping {len(kept)} non-silent interval(s).")
+        if not kept:
+            self.log("Nothing to keep (everything considered silence).")
+            return 1
+
+        # Normalize intervals: resolve open ends, drop empties
+        intervals = []
+        for a, b in kept:
+            if b is None:
+                b = duration
+            if b > a:
+                intervals.append((a, b))
+        if not intervals:
+            self.log("No intervals left after filtering.")
+            return 1
+
+        durations = [b - a for a, b in intervals]
+
+        if crossfade > 0 and len(intervals) > 1:
+            # Prevent enormous graphs from blowing up on extreme segment counts.
+            if len(intervals) > 120:
+                self.log(f"Too many segments ({len(intervals)}). Falling back to hard cuts.")
+                return self._cut_hard(input_path, output_path, intervals, duration)
+            return self._concat_crossfade(input_path, intervals, durations, crossfade, output_path)
+
+        return self._cut_hard(input_path, output_path, intervals, duration)
+
+    def _cut_hard_copy(self, input_path: Path, output_path: Path, intervals, duration=0.0):
+        """
+        Produce all cuts in ONE demux pass: the segment muxer splits the
+        input at every kept-interval boundary with -c copy, then the
+        segments that fall inside kept intervals are joined with the concat
+        demuxer. Near-zero CPU, no generation loss, and exactly two ffmpeg
+        invocations regardless of cut count — at the cost of cuts landing
+        on keyframe boundaries.
+        """
+        self._check_cancelled()
+        tmpdir = Path(tempfile.mkdtemp(prefix="silencer_copycut_"))
+        try:
+            # Exclude EOF from the split times: a video that doesn't end in
+            # silence has its last kept interval end exactly at `duration`,
+            # and the muxer never opens a segment there (no frame with a pts
+            # past it arrives) — which would trip the count check below on
+            # perfectly splittable inputs.
+            end = duration if duration > 0 else float("inf")
+            boundaries = sorted({t for iv in intervals for t in iv if 0 < t < end})
+            ffmpeg = self.get_ffmpeg()
+            cmd = [
+                ffmpeg, "-hide_banner", "-y",
+                "-i", str(input_path),
+                "-f", "segment",
+                "-segment_times", ",".join(f"{t:.6f}" for t in boundaries),
+                "-reset_timestamps", "1",
+                "-map", "0", "-c", "copy",
+                str(tmpdir / "seg_%04d.mp4")
+            ]
+            rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self.proc_setter)
+            if rc != 0:
+                return rc
+
+            # Segment i spans [bounds[i], bounds[i+1]); keep the ones whose
+            # midpoint lies inside a kept interval (the rest are silence).
+            # The muxer can only split at keyframes, so boundaries that fall
+            # inside one GOP collapse into a single segment — every later
+            # index then shifts and the midpoint test would keep silence and
+            # drop speech. Bail out to the re-encode fallback instead.
+            bounds = [0.0] + boundaries
+            segments = sorted(tmpdir.glob("seg_*.mp4"))
+            if len(segments) != len(bounds):
+                self.log(
+                    f"Segment count mismatch ({len(segments)} emitted, "
+                    f"{len(bounds)} expected): cut points don't align with keyframes."
+                )
+                return 1
+            keep = []
+            for i, seg in enumerate(segments):
+                lo = bounds[i]
+                # The last segment runs to the end of the final kept interval
+                # (i.e. to EOF when the video doesn't end in silence).
+                hi = bounds[i + 1] if i + 1 < len(bounds) else max(intervals[-1][1], lo)
+                mid = (lo + hi) / 2.0
+                if any(a <= mid < b for a, b in intervals):
+                    keep.append(seg)
+            if not keep:
+                return 1
+            if len(keep) == 1:
+                # Single kept segment: the temp file is ours, so an atomic
+                # rename (O(1)) beats copying N hundred MB. Cross-device
+                # falls back to copyfile (sendfile/CopyFileW underneath).
+                try:
+                    os.replace(keep[0], output_path)
+                except OSError:
+                    shutil.copyfile(keep[0], output_path)
+                return 0
+            return self._concat_hard(keep, output_path)
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def _cut_hard(self, input_path: Path, output_path: Path, intervals, duration=0.0):
+        """Hard-cut path: stream-copy first, re-encode filter pipeline as fallback."""
+        self.log("Hard cuts will be keyframe-aligned (stream copy, no re-encode).")
+        rc = self._cut_hard_copy(input_path, output_path, intervals, duration)
+        if rc == 0:
+            return 0
+        self.log("Stream-copy cut failed; falling back to re-encode...")
+        if len(intervals) <= self.MAX_FILTER_INTERVALS:
+            self._cut_concat_single_pass(input_path, output_path, intervals)
+            return 0
+
+        # Chunk huge interval counts so the filter_complex arg stays bounded,
+        # then join the chunk outputs with the concat demuxer.
+        tmpdir = Path(tempfile.mkdtemp(prefix="silencer_chunks_"))
+        try:
+            chunks = []
+            for ci in range(0, len(intervals), self.MAX_FILTER_INTERVALS):
+                group = intervals[ci:ci + self.MAX_FILTER_INTERVALS]
+                chunk = tmpdir / f"chunk_{ci // self.MAX_FILTER_INTERVALS:04d}.mp4"
+                # No frames branch per chunk: numbering would restart each chunk.
+                self._cut_concat_single_pass(input_path, chunk, group, fuse_frames=False)
+                chunks.append(chunk)
+            return self._concat_hard(chunks, output_path)
+        finally:
+            # Best-effort cleanup
+            try:
+                shutil.rmtree(tmpdir, ignore_errors=True)
+            except Exception:
+                pass
+
+
+# --------------------------
+# Helpers
+# --------------------------
+
+_number_re = re.compile(r"(\d+)")
+
+
+@functools.lru_cache(maxsize=None)
+def _natural_key_str(s: str):
+    """Memoized key for a stem; tuples are hashable and compare fast."""
+    return tuple(int(t) if t.isdigit() else t.lower() for t in _number_re.split(s))
+
+
+def natural_key(p: Path):
+    """
+    Numeric-aware sort: "2.mp4" comes before "10.mp4".
+    Works on the file's stem.
+    """
+    return _natural_key_str(p.stem)
+
+
+_KEEP_SUFFIXES = (".mp4", ".mov", ".mkv", ".m4v")
+
+def add_autocut_suffix(p: Path) -> Path:
+    suffix = p.suffix if p.suffix.lower() in _KEEP_SUFFIXES else ".mp4"
+    return p.with_name(p.stem + "_autocut" + suffix)
+
+
+def is_video_file(p: Path) -> bool:
+    return p.suffix.lower() in VIDEO_EXTS
+
+
+# --------------------------
+# GUI
+# --------------------------
+
+class App(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title(APP_TITLE)
+        self.geometry("940x680")
+        self.minsize(860, 620)
+
+        self.settings = dict(DEFAULTS)
+
+        # Inputs
+        self.input_path = tk.StringVar()     # file or folder
+        self.output_path = tk.StringVar()    # single-file mode target
+        self.backend = tk.StringVar(value=self.settings["backend"])
+        self.threshold_db = tk.DoubleVar(value=self.settings["threshold_db"])
+        self.min_silence = tk.DoubleVar(value=self.settings["min_silence"])
+        self.margin = tk.DoubleVar(value=self.settings["margin"])
+        self.crossfade = tk.DoubleVar(value=self.settings["crossfade"])
+        self.audio_track = tk.IntVar(value=self.settings["audio_track"])
+        self.min_clip_len = tk.DoubleVar(value=self.settings["min_clip_len"])
+        self.ffmpeg_path = tk.StringVar(value=self.settings["ffmpeg_path"])
+        self.open_in_shotcut = tk.BooleanVar(value=False)
+        self.shotcut_path = tk.StringVar(value="")
+        self.extract_frames = tk.BooleanVar(value=False)
+        self.frames_folder = tk.StringVar(value="")
+        self.parallel_jobs = tk.IntVar(value=self.settings["parallel_jobs"])
+        self.hw_encode = tk.BooleanVar(value=self.settings["hw_encode"])
+
+        self.running = False
+        self.worker_thread = None
+
+        self.stop_event = threading.Event()
+        self._active_procs = {}
+        self._post_pool = None  # set for the lifetime of a batch run
+        self._proc_lock = threading.Lock()
+        # Bounded log ring: workers append, the Tk 'after' pump drains.
+        self._log_queue = collections.deque(maxlen=10000)
+
+        self._build_ui()
+        self._toggle_frames_controls()
+        self.after(50, self._drain_log)
+
+    # Keep the Text widget bounded to this many lines.
+    LOG_KEEP_LINES = 5000
+
+    def log(self, msg: str):
+        """Thread-safe: queue the line; _drain_log flushes batches to the widget."""
+        self._log_queue.append(msg)
+
+    def _drain_log(self):
+        batch = []
+        while self._log_queue and len(batch) < 500:
+            batch.append(self._log_queue.popleft())
+        if batch:
+            self.txt_log.insert(tk.END, "\n".join(batch) + "\n")
+            self.txt_log.delete("1.0", f"end-{self.LOG_KEEP_LINES}l")
+            self.txt_log.see(tk.END)
+        # Re-arm sooner while a burst is backed up, at the usual cadence when idle.
+        self.after(10 if self._log_queue else 50, self._drain_log)
+
+
+    def _set_active_proc(self, proc):
+        """Track the running subprocess for this worker thread so Stop can kill it."""
+        with self._proc_lock:
+            if proc is None:
+                self._active_procs.pop(threading.get_ident(), None)
+            else:
+                self._active_procs[threading.get_ident()] = proc
+
+    def on_stop(self):
+        """Stop current operation (best-effort, terminates all live children)."""
+        try:
+            self.stop_event.set()
+            with self._proc_lock:
+                procs = list(self._active_procs.values())
+            for proc in procs:
+                try:
+                    proc.terminate()
+                except Exception:
+                    pass
+            self.log("⛔ Stop requested.")
+        except Exception:
+            pass
+
+    # ---------- Browsers ----------
+    def browse_input_file(self):
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(
+            title="Choose input video",
+            filetypes=[("Video files", ".mp4 .mov .mkv .avi .m4v .webm .wmv .flv"), ("All files", "*.*")]
+        )
+        if path:
+            self.input_path.set(path)
+            in_p = Path(path)
+            out = add_autocut_suffix(in_p)
+            self.output_path.set(str(out))
+
+    def browse_input_folder(self):
+        from tkinter import filedialog
+        path = filedialog.askdirectory(title="Choose input folder (batch mode)")
+        if path:
+            self.input_path.set(path)
+            # In folder mode, we don't set output_path; each file gets its own, plus a final combined output.
+
+    def browse_output(self):
+        from tkinter import filedialog
+        path = filedialog.asksaveasfilename(
+            title="Save output as", defaultextension=".mp4",
+            filetypes=[("MP4 video", ".mp4"), ("All files", "*.*")]
+        )
+        if path:
+            self.output_path.set(path)
+
+    def browse_ffmpeg(self):
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(title="Path to ffmpeg executable")
+        if path:
+            self.ffmpeg_path.set(path)
+
+    def browse_shotcut(self):
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(title="Path to Shotcut executable")
+        if path:
+            self.shotcut_path.set(path)
+
+    def browse_frames_folder(self):
+        from tkinter import filedialog
+        path = filedialog.askdirectory(title="Choose folder for extracted frames")
+        if path:
+            self.frames_folder.set(path)
+
+    def _toggle_frames_controls(self):
+        enabled = self.extract_frames.get()
+        state = "normal" if enabled else "disabled"
+        try:
+            self.ent_frames_folder.configure(state=state)
+            self.btn_frames_browse.configure(state=state)
+        except Exception:
+            pass
+
+    def _toggle_shotcut_path(self):
+        enabled = self.open_in_shotcut.get()
+        state = "normal" if enabled else "disabled"
+        frm_open = self.winfo_children()[2]
+        entries = frm_open.winfo_children()
+        entries[1].configure(state=state)
+        entries[2].configure(state=state)
+
+    # ---------- UI ----------
+    def _build_ui(self):
+        pad = {"padx": 8, "pady": 6}
+
+        frm_top = ttk.LabelFrame(self, text="Input/Output")
+        frm_top.pack(fill=tk.X, **pad)
+        ttk.Label(frm_top, text="Input (file OR folder):").grid(row=0, column=0, sticky=tk.W)
+        ttk.Entry(frm_top, textvariable=self.input_path, width=72).grid(row=0, column=1, columnspan=2, sticky=tk.W)
+        ttk.Button(frm_top, text="Browse File", command=self.browse_input_file).grid(row=0, column=3)
+        ttk.Button(frm_top, text="Browse Folder", command=self.browse_input_folder).grid(row=0, column=4)
+
+        ttk.Label(frm_top, text="Output file (single-file mode):").grid(row=1, column=0, sticky=tk.W)
+        ttk.Entry(frm_top, textvariable=self.output_path, width=72).grid(row=1, column=1, columnspan=2, sticky=tk.W)
+        ttk.Button(frm_top, text="Browse", command=self.browse_output).grid(row=1, column=3)
+
+        # Frame extraction (optional)
+        ttk.Label(frm_top, text="Extract 1 in every 30 frames:").grid(row=2, column=0, sticky=tk.W)
+        ttk.Checkbutton(
+            frm_top,
+            text="Enable",
+            variable=self.extract_frames,
+            command=self._toggle_frames_controls
+        ).grid(row=2, column=1, sticky=tk.W)
+        self.ent_frames_folder = ttk.Entry(frm_top, textvariable=self.frames_folder, width=56, state="disabled")
+        self.ent_frames_folder.grid(row=2, column=2, columnspan=2, sticky=tk.W)
+        self.btn_frames_browse = ttk.Button(frm_top, text="Frames Folder", command=self.browse_frames_folder, state="disabled")
+        self.btn_frames_browse.grid(row=2, column=4)
+
+        ttk.Label(frm_top, text="Backend:").grid(row=3, column=0, sticky=tk.W)
+        ttk.Combobox(frm_top, textvariable=self.backend, values=["Auto-Editor", "FFmpeg"],
+                     state="readonly", width=18).grid(row=3, column=1, sticky=tk.W)
+
+        frm_params = ttk.LabelFrame(self, text="Parameters")
+        frm_params.pack(fill=tk.X, **pad)
+
+        # Row 0
+        ttk.Label(frm_params, text="Threshold (dBFS)").grid(row=0, column=0, sticky=tk.W)
+        ttk.Entry(frm_params, textvariable=self.threshold_db, width=10).grid(row=0, column=1)
+        ttk.Label(frm_params, text="Min silence (s)").grid(row=0, column=2, sticky=tk.W)
+        ttk.Entry(frm_params, textvariable=self.min_silence, width=10).grid(row=0, column=3)
+
+        # Row 1
+        ttk.Label(frm_params, text="Margin (s)").grid(row=1, column=0, sticky=tk.W)
+        ttk.Entry(frm_params, textvariable=self.margin, width=10).grid(row=1, column=1)
+        ttk.Label(frm_params, text="Crossfade (s)").grid(row=1, column=2, sticky=tk.W) # <--- NEW
+        ttk.Entry(frm_params, textvariable=self.crossfade, width=10).grid(row=1, column=3)
+
+        # Row 2
+        ttk.Label(frm_params, text="Min kept clip (s)").grid(row=2, column=0, sticky=tk.W)
+        ttk.Entry(frm_params, textvariable=self.min_clip_len, width=10).grid(row=2, column=1)
+        ttk.Label(frm_params, text="Audio track").grid(row=2, column=2, sticky=tk.W)
+        ttk.Entry(frm_params, textvariable=self.audio_track, width=10).grid(row=2, column=3)
+        ttk.Label(frm_params, text="Parallel jobs").grid(row=2, column=4, sticky=tk.W)
+        ttk.Spinbox(frm_params, textvariable=self.parallel_jobs, from_=1, to=16, width=8).grid(row=2, column=5)
+
+        # Row 3
+        ttk.Label(frm_params, text="FFmpeg path (opt)").grid(row=3, column=0, sticky=tk.W)
+        ttk.Entry(frm_params, textvariable=self.ffmpeg_path, width=38).grid(row=3, column=1, columnspan=3, sticky=tk.W)
+        ttk.Button(frm_params, text="Browse", command=self.browse_ffmpeg).grid(row=3, column=4, padx=4)
+        ttk.Checkbutton(frm_params, text="Use GPU encoder if available",
+                        variable=self.hw_encode).grid(row=3, column=5, sticky=tk.W)
+
+        frm_open = ttk.Frame(self)
+        frm_open.pack(fill=tk.X, **pad)
+        ttk.Checkbutton(frm_open, text="Open output in Shotcut on finish",
+                        variable=self.open_in_shotcut,
+                        command=self._toggle_shotcut_path).pack(side=tk.LEFT)
+        ttk.Entry(frm_open, textvariable=self.shotcut_path, width=50, state="disabled").pack(side=tk.LEFT, padx=6)
+        ttk.Button(frm_open, text="Browse", command=self.browse_shotcut, state="disabled").pack(side=tk.LEFT)
+
+        frm_btns = ttk.Frame(self)
+        frm_btns.pack(fill=tk.X, **pad)
+        ttk.Button(frm_btns, text="Run", command=self.on_run).pack(side=tk.LEFT)
+        ttk.Button(frm_btns, text="Stop", command=self.on_stop).pack(side=tk.LEFT, padx=6)
+        ttk.Button(frm_btns, text="Install/Update Auto-Editor", command=self.install_autoeditor).pack(side=tk.LEFT)
+
+        frm_log = ttk.LabelFrame(self, text="Log")
+        frm_log.pack(fill=tk.BOTH, expand=True, **pad)
+        self.txt_log = tk.Text(frm_log, height=18, wrap="word")
+        self.txt_log.pack(fill=tk.BOTH, expand=True)
+
+    # ---------- Run / Workers ----------
+    def on_run(self):
+        from tkinter import messagebox
+
+        if self.running:
+            messagebox.showinfo("Busy", "Already running.")
+            return
+
+        in_path = Path(self.input_path.get().strip())
+        if not in_path.exists():
+            messagebox.showerror("Missing input", "Please choose a valid input file or folder.")
+            return
+
+        # Validate single-file output path only in file mode
+        if in_path.is_file():
+            out_path = Path(self.output_path.get().strip()) if self.output_path.get().strip() else add_autocut_suffix(in_path)
+            if not out_path.parent.exists():
+                messagebox.showerror("Invalid output", f"Output folder doesn't exist: {out_path.parent}")
+                return
+
+        self.settings.update({
+            "backend": self.backend.get(),
+            "threshold_db": float(self.threshold_db.get()),
+            "min_silence": float(self.min_silence.get()),
+            "margin": float(self.margin.get()),
+            "crossfade": float(self.crossfade.get()),  # <--- NEW
+            "audio_track": int(self.audio_track.get()),
+            "min_clip_len": float(self.min_clip_len.get()),
+            "ffmpeg_path": self.ffmpeg_path.get().strip(),
+            "extract_frames": bool(self.extract_frames.get()),
+            "frames_folder": self.frames_folder.get().strip(),
+            "parallel_jobs": int(self.parallel_jobs.get()),
+            "hw_encode": bool(self.hw_encode.get()),
+        })
+
+        # ffmpeg_path may have changed; drop the cached binary resolution
+        # (and the encoder probe tied to it)
+        self.__dict__.pop("_ffmpeg_bin", None)
+        self.__dict__.pop("_hw_encoder_args", None)
+        self.__dict__.pop("_ffprobe_bin", None)
+
+        self.running = True
+
+        self.stop_event.clear()
+        self.running = True
+        self.txt_log.delete("1.0", tk.END)
+        self.log("Starting...")
+
+        if in_path.is_dir():
+            self.worker_thread = threading.Thread(target=self._batch_worker, args=(in_path,), daemon=True)
+            self.worker_thread.start()
+        else:
+            self.worker_thread = threading.Thread(target=self._single_worker, args=(in_path,), daemon=True)
+            self.worker_thread.start()
+
+    def _make_backend(self, log=None):
+        log = log or self.log
+        if self.settings["backend"] == "Auto-Editor":
+            return AutoEditorBackend(self.settings, log, stop_event=self.stop_event, proc_setter=self._set_active_proc)
+        return FFmpegBackend(self.settings, log, stop_event=self.stop_event, proc_setter=self._set_active_proc)
+
+    def _single_worker(self, in_path: Path):
+        try:
+            start = time.time()
+            extract_frames = bool(self.settings.get("extract_frames"))
+            out = self.output_path.get().strip()
+            out_path = Path(out) if out else add_autocut_suffix(in_path)
+            backend = self._make_backend()
+            if extract_frames and isinstance(backend, FFmpegBackend):
+                frames_root = self._resolve_frames_root(in_path, out_path)
+                backend.frames_dir = frames_root / out_path.stem
+            rc = backend.run(in_path, out_path)
+            dur = time.time() - start
+            if rc == 0:
+                self.log(f"\n✅ Done in {dur:.1f}s → {out_path}")
+                self.play_done_sound()
+                if extract_frames and not getattr(backend, "frames_written", False):
+                    frames_root = self._resolve_frames_root(in_path, out_path)
+                    self._extract_sampled_frames(out_path, frames_root, interval=FRAME_EXTRACT_INTERVAL)
+                self.open_in_shotcut_if_requested(out_path)
+            else:
+                self.log(f"\n❌ FAILED with exit code {rc}")
+        finally:
+            self.running = False
+
+    def _batch_worker(self, folder: Path):
+        start = time.time()
+        log = self.log  # worker-local: skips an attribute hop per line
+        try:
+            log(f"Batch mode: scanning folder → {folder}")
+            # scandir: DirEntry.is_file() uses readdir-cached info, no extra
+            # stat per entry, and splitext on the raw name skips a Path build.
+            with os.scandir(folder) as it:
+                files = [Path(e.path) for e in it
+                         if e.is_file()
+                         and os.path.splitext(e.name)[1].lower() in VIDEO_EXTS
+                         and "_autocut" not in e.name.lower()]
+
+            if not files:
+                log("No input videos found (or they all look already processed).")
+                return
+
+            files.sort(key=natural_key)
+            total = len(files)
+            jobs = min(total, max(1, int(self.settings.get("parallel_jobs", 1))))
+            log(f"Found {total} video(s) to process ({jobs} parallel job(s)).")
+
+            # Frame extraction is decode/IO bound and independent of the next
+            # encode, so it drains on its own single worker instead of
+            # occupying an encode slot.
+            self._post_pool = ThreadPoolExecutor(max_workers=1)
+            try:
+                with ThreadPoolExecutor(max_workers=jobs) as ex:
+                    futures = {ex.submit(self._process_one, src, folder): src for src in files}
+                    done = 0
+                    for fut in as_completed(futures):
+                        src = futures[fut]
+                        done += 1
+                        try:
+                            fut.result()
+                        except Exception as e:
+                            log(f"[{src.name}] ❌ FAILED: {e} — continuing")
+                        log(f"[{done}/{total}] finished: {src.name}")
+            finally:
+                # Only declare the batch complete once post-processing drains.
+                self._post_pool.shutdown(wait=True)
+                self._post_pool = None
+
+            log("\n🎬 All videos processed individually (no megacut).")
+            dur = time.time() - start
+            log(f"\nBatch complete in {dur:.1f}s.")
+            self.play_done_sound()
+
+        finally:
+            self.running = False
+
+    def _process_one(self, src: Path, folder: Path) -> bool:
+        """Process a single batch video: cut, fade, optional frame extraction."""
+        def log(msg):
+            self.log(f"[{src.name}] {msg}")
+
+        extract_frames = bool(self.settings.get("extract_frames"))
+        out_path = add_autocut_suffix(src)
+        log("Processing...")
+        backend = self._make_backend(log=log)
+        if extract_frames and isinstance(backend, FFmpegBackend):
+            backend.frames_dir = self._resolve_frames_root(folder, out_path) / out_path.stem
+        rc = backend.run(src, out_path)
+        # rc == 0 guarantees out_path exists (backend post-condition), and
+        # _fade_output always returns an existing file — no extra stats here,
+        # which matters on network shares with 100+ file batches.
+        if rc == 0:
+            log(f"✅ Wrote {out_path.name}")
+            # Always apply fade to each output file
+            final_vid = self._fade_output(out_path)
+            if extract_frames and not getattr(backend, "frames_written", False):
+                frames_root = self._resolve_frames_root(folder, Path(final_vid))
+                pool = self._post_pool
+                if pool is not None:
+                    # Overlap extraction with the next file's encode. The
+                    # future's exception must be surfaced here — nothing
+                    # else ever calls result() on it (e.g. mkdir on a bad
+                    # frames_folder raises before any internal logging).
+                    def _report(fut, log=log):
+                        exc = fut.exception()
+                        if exc is not None:
+                            log(f"⚠ Frame extraction failed: {exc}")
+                    pool.submit(self._extract_sampled_frames, Path(final_vid),
+                                frames_root, FRAME_EXTRACT_INTERVAL).add_done_callback(_report)
+                else:
+                    self._extract_sampled_frames(Path(final_vid), frames_root, interval=FRAME_EXTRACT_INTERVAL)
+            return True
+        log(f"❌ FAILED (exit {rc}) — continuing")
+        return False
+
+    def _resolve_frames_root(self, in_path: Path, out_video: Path) -> Path:
+        """Pick the root folder where per-video frame folders will be created."""
+        root = (self.settings.get("frames_folder") or "").strip()
+        if root:
+            return Path(root)
+        # Default roots:
+        if in_path.is_dir():
+            # batch mode default: <input_folder>/<input_folder_name>_frames
+            return in_path / f"{in_path.name}_frames"
+        # single mode default: <output_parent>/<output_stem>_frames
+        return out_video.parent / f"{out_video.stem}_frames"
+
+    def _extract_sampled_frames(self, video: Path, frames_root: Path, interval: int = FRAME_EXTRACT_INTERVAL) -> int:
+        """
+        Extract 1 out of every `interval` frames to
+        frames_root/<video_stem>/frame_XXXXXX.<frame_format>.
+
+        The on-disk files are the deliverable here — nothing in this app
+        consumes them afterwards — so there's no benefit to piping rawvideo
+        into memory (image2pipe) and writing selectively; that only pays off
+        when frames feed a downstream in-process pass.
+        """
+        frames_root.mkdir(parents=True, exist_ok=True)
+        out_dir = frames_root / video.stem
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        if cv2 is not None:
+            self.log(f"🖼 Extracting frames (1/{interval}, grab/retrieve) → {out_dir}")
+            rc = self._extract_sampled_frames_cv2(video, out_dir, interval)
+            if rc == 0:
+                self.log(f"✅ Frames written to: {out_dir}")
+                return 0
+            self.log("⚠ OpenCV frame sampler failed; falling back to FFmpeg.")
+
+        ff = self._ffmpeg_bin
+
+        # FFmpeg filter: select frames where n % interval == 0
+        # Comma must be escaped for FFmpeg expression parsing.
+        vf = f"select=not(mod(n\\,{interval}))"
+
+        # JPEG by default: FFmpeg's png encoder zlib-compresses every frame
+        # and dominates extraction time once decode is sampled down.
+        fmt = self.settings.get("frame_format", "jpg")
+        out_pattern = str(out_dir / f"frame_%06d.{fmt}")
+        cmd = [
+            ff, "-hide_banner", "-y",
+            "-i", str(video),
+            "-vf", vf,
+            "-vsync", "vfr",
+        ]
+        if fmt == "jpg":
+            cmd += ["-q:v", "3"]
+        cmd.append(out_pattern)
+        self.log(f"🖼 Extracting frames (1/{interval}) → {out_dir}")
+        # log_callback=None: ffmpeg's per-second progress chatter is noise
+        # here (extraction overlaps the next encode on the post pool), and
+        # the silent path skips the drain thread entirely. Failures are
+        # still surfaced via the exit code below.
+        rc = run_subprocess(cmd, None, stop_event=self.stop_event, proc_setter=self._set_active_proc)
+        if rc == 0:
+            self.log(f"✅ Frames written to: {out_dir}")
+        else:
+            self.log(f"⚠ Frame extraction failed (exit {rc}) for: {video.name}")
+        return rc
+
+    def _extract_sampled_frames_cv2(self, video: Path, out_dir: Path, interval: int) -> int:
+        """
+        Sample frames with OpenCV's two-step reader: grab() advances the
+        demuxer without decoding, retrieve() decodes only the 1-in-N frames
+        we actually keep — ~interval× less decode work than a select filter.
+        """
+        cap = cv2.VideoCapture(str(video))
+        if not cap.isOpened():
+            return 1
+        fmt = self.settings.get("frame_format", "jpg")
+        write_args = [cv2.IMWRITE_JPEG_QUALITY, 90] if fmt == "jpg" else []
+        n = 0
+        saved = 0
+        try:
+            while cap.grab():
+                if self.stop_event.is_set():
+                    return 1
+                if n % interval == 0:
+                    ok, frame = cap.retrieve()
+                    if ok:
+                        cv2.imwrite(str(out_dir / f"frame_{saved:06d}.{fmt}"), frame, write_args)
+                        saved += 1
+                n += 1
+        except Exception as e:
+            self.log(f"⚠ OpenCV sampling error: {e}")
+            return 1
+        finally:
+            cap.release()
+        return 0 if saved else 1
+
+    @functools.cached_property
+    def _ffmpeg_bin(self) -> str:
+        """Resolved ffmpeg path; invalidated in on_run when settings change."""
+        return FFmpegBackend(self.settings, self.log).get_ffmpeg()
+
+    @functools.cached_property
+    def _ffprobe_bin(self) -> str:
+        """Resolved ffprobe path; invalidated in on_run when settings change."""
+        return FFmpegBackend(self.settings, self.log).get_ffprobe()
+
+    # Software fade encoder; also the runtime fallback when a listed GPU
+    # encoder turns out not to have a usable device behind it.
+    SW_FADE_ARGS = ["-c:v", "libx264", "-preset", "veryfast", "-crf", "20"]
+
+    @functools.cached_property
+    def _hw_encoder_args(self) -> list:
+        """
+        Video-encoder args for the fade pass, probed once per run. Prefers a
+        GPU encoder (NVENC, then QSV, then AMF) when this ffmpeg build has
+        one; FFmpeg auto-inserts the hwupload/hwdownload needed around the
+        fade filter. Falls back to libx264 — and _fade_output overwrites this
+        cache with SW_FADE_ARGS the first time a GPU encode fails, since
+        -encoders can't tell a compiled-in encoder from a working device.
+        """
+        try:
+            r = subprocess.run(
+                [self._ffmpeg_bin, "-hide_banner", "-encoders"],
+                capture_output=True, text=True,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            )
+            encoders = r.stdout if r.returncode == 0 else ""
+        except Exception:
+            encoders = ""
+        if "h264_nvenc" in encoders:
+            return ["-c:v", "h264_nvenc", "-preset", "p1", "-rc", "constqp", "-qp", "20"]
+        if "h264_qsv" in encoders:
+            return ["-c:v", "h264_qsv", "-global_quality", "20", "-preset", "veryfast"]
+        if "h264_amf" in encoders:
+            return ["-c:v", "h264_amf", "-quality", "speed"]
+        return self.SW_FADE_ARGS
+
+    def _get_duration(self, video: Path) -> float:
+        """Return duration (seconds) using ffprobe (no window, memoized)."""
+        try:
+            mtime_ns = video.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        return _cached_duration(self._ffprobe_bin, str(video), mtime_ns)
+
+    def _get_total_duration(self, paths) -> float:
+        """
+        Total duration of several files from ONE ffprobe call, using the
+        concat demuxer as a virtual input — N-1 fewer process spawns than
+        probing per file. (ffprobe can't report per-file durations for a
+        concat input; when those are needed, _get_duration's memoizer is
+        the fallback, as it is here if the concat probe fails.)
+        """
+        paths = list(paths)
+        if not paths:
+            return 0.0
+        with tempfile.TemporaryDirectory() as td:
+            list_file = Path(td) / "probe.txt"
+            self._write_concat_list(list_file, paths)
+            cmd = [
+                self._ffprobe_bin, "-v", "error",
+                "-f", "concat", "-safe", "0",
+                "-i", str(list_file),
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1"
+            ]
+            creationflags = 0
+            if os.name == "nt":
+                creationflags = subprocess.CREATE_NO_WINDOW
+            try:
+                r = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                   creationflags=creationflags)
+                total = float((r.stdout or b"").strip() or 0.0)
+                if total > 0:
+                    return total
+            except Exception:
+                pass
+        return sum(self._get_duration(p) for p in paths)
+
+    def _fade_output(self, video: Path):
+        """Apply fade-to-black to the end of a video safely.
+
+        Skipped entirely — no re-encode — when fades are disabled, when the
+        clip is too short for a 2s fade to make sense, or when a previous
+        run already faded this file (sidecar marker '<name>.faded').
+        """
+        if not self.settings.get("apply_fade", True):
+            return video
+        marker = video.with_suffix(video.suffix + ".faded")
+        try:
+            # Only trust a marker newer than the video: re-running a batch
+            # rewrites foo_autocut.mp4 with a fresh unfaded cut, and a stale
+            # marker from the previous run must not skip the fade then.
+            if marker.stat().st_mtime >= video.stat().st_mtime:
+                self.log(f"Skipping fade (already faded): {video.name}")
+                return video
+        except OSError:
+            pass  # no marker (or unreadable): fade as usual
+        ff = self._ffmpeg_bin
+        dur = self._get_duration(video)
+        if dur <= 0:
+            self.log(f"⚠ Unable to determine duration for fade: {video}")
+            return video
+        if dur < 4.0:
+            self.log(f"Skipping fade (clip too short, {dur:.1f}s): {video.name}")
+            return video
+
+        # Create a temp output next to original
+        temp_out = video.with_name(video.stem + "_fade.mp4")
+        fade_filter = f"fade=t=out:st={max(dur-2,0):.2f}:d=2"
+
+        def fade_cmd(enc_args):
+            return [
+                ff, "-hide_banner", "-y",
+                "-i", str(video),
+                "-vf", fade_filter,
+                *enc_args,
+                "-c:a", "copy",
+                str(temp_out)
+            ]
+
+        if self.settings.get("hw_encode", True):
+            enc_args = self._hw_encoder_args
+        else:
+            enc_args = self.SW_FADE_ARGS
+        cmd = fade_cmd(enc_args)
+        self.log("Applying fade (safe mode): " + " ".join(cmd))
+        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self._set_active_proc)
+        if rc != 0 and enc_args is not self.SW_FADE_ARGS and not self.stop_event.is_set():
+            # -encoders only proves the encoder was compiled in; a full build
+            # lists nvenc/qsv/amf on machines without the GPU and the encode
+            # fails at open time. Pin software for the rest of the run and
+            # retry so those users don't silently lose every fade.
+            self.log("⚠ Hardware fade encode failed; retrying with libx264.")
+            self.__dict__["_hw_encoder_args"] = self.SW_FADE_ARGS
+            rc = run_subprocess(fade_cmd(self.SW_FADE_ARGS), self.log,
+                                stop_event=self.stop_event, proc_setter=self._set_active_proc)
+        if rc == 0:  # ffmpeg exits 0 only after finalizing temp_out
+            try:
+                # Atomic on the same volume: no window where the original is
+                # gone but the faded file isn't in place yet.
+                os.replace(temp_out, video)
+                try:
+                    marker.touch()
+                except OSError:
+                    pass  # marker is an optimization only
+                self.log(f"✅ Fade applied to {video.name}")
+                return video
+            except Exception as e:
+                self.log(f"⚠ Fade succeeded but replace failed: {e}")
+                return temp_out
+        else:
+            self.log("⚠ Fade failed, keeping original.")
+            return video
+
+    @staticmethod
+    def _write_concat_list(list_file: Path, paths):
+        # One write_bytes call: no per-line buffer churn, and the list is
+        # never visible half-written. Quoting: av_get_token copies verbatim
+        # inside single quotes, so an embedded ' must close the string,
+        # backslash-escape the quote, and reopen ('\'') — \' alone leaves
+        # the quote open and corrupts the entry.
+        list_file.write_bytes(b"".join(
+            b"file '" + str(p).replace("'", "'\\''").encode("utf-8") + b"'\n"
+            for p in paths
+        ))
+
+    def _concat_cmd(self, list_file: Path, out_path: Path, fade_start=None):
+        """Concat-demuxer command; fade_start fuses the end fade into the pass."""
+        cmd = [
+            self._ffmpeg_bin, "-hide_banner", "-y",
+            "-f", "concat", "-safe", "0",
+            "-i", str(list_file),
+        ]
+        if fade_start is not None:
+            cmd += ["-vf", f"fade=t=out:st={max(fade_start, 0):.2f}:d=2", "-c:a", "copy"]
+        else:
+            cmd += ["-c", "copy"]
+        cmd.append(str(out_path))
+        return cmd
+
+    def _concat_outputs(self, outputs: list[Path], final_path: Path) -> int:
+        """
+        Concatenate with the end fade fused into the same FFmpeg pass.
+        Batches over 8 hours (28800s) are emitted as PART1/PART2 directly
+        from two concat lists, splitting at the input boundary nearest the
+        halfway point — the monolithic combined file is never written, so
+        tens of GB aren't read back twice just to be split.
+        """
+        # ✅ No per-clip fades anymore
+        faded = outputs[:]  # just pass them along unchanged
+
+        with tempfile.TemporaryDirectory() as td:
+            total_dur = self._get_total_duration(faded)
+            self.log(f"Combined duration: {total_dur/3600:.2f} hours")
+
+            if total_dur <= 28800 or len(faded) < 2:  # 8 hours
+                list_file = Path(td) / "concat.txt"
+                self._write_concat_list(list_file, faded)
+                if total_dur <= 0:
+                    # Unknown duration would clamp the fade to st=0 and black
+                    # out the whole video; skip the fade rather than guess.
+                    self.log("⚠ Unable to determine duration; combining without end fade.")
+                    fade_start = None
+                else:
+                    fade_start = total_dur - 2
+                cmd = self._concat_cmd(list_file, final_path, fade_start=fade_start)
+                self.log("Combining with: " + " ".join(cmd))
+                return run_subprocess(cmd, self.log, stop_event=self.stop_event,
+                                      proc_setter=self._set_active_proc)
+
+            self.log("Over 8 hours — emitting PART 1 and PART 2 directly")
+            durs = [self._get_duration(p) for p in faded]
+            if any(d <= 0 for d in durs):
+                # Can't place the boundary without per-file durations; fall
+                # back to the monolithic combine + post-split.
+                return self._concat_and_split_monolithic(td, faded, final_path, total_dur)
+
+            half = total_dur / 2
+            cum = 0.0
+            split_at = len(faded) - 1
+            for idx, d in enumerate(durs[:-1], 1):
+                cum += d
+                if cum >= half:
+                    split_at = idx
+                    break
+
+            part1 = final_path.with_name(final_path.stem + "_PART1.mp4")
+            part2 = final_path.with_name(final_path.stem + "_PART2.mp4")
+            list_a = Path(td) / "concat_a.txt"
+            list_b = Path(td) / "concat_b.txt"
+            self._write_concat_list(list_a, faded[:split_at])
+            self._write_concat_list(list_b, faded[split_at:])
+
+            rc = run_subprocess(self._concat_cmd(list_a, part1), self.log,
+                                stop_event=self.stop_event, proc_setter=self._set_active_proc)
+            if rc != 0:
+                return rc
+            # Only PART2 carries the end fade, matching the old behaviour of
+            # fading the combined file before splitting.
+            rc = run_subprocess(self._concat_cmd(list_b, part2, fade_start=sum(durs[split_at:]) - 2),
+                                self.log, stop_event=self.stop_event, proc_setter=self._set_active_proc)
+            if rc != 0:
+                return rc
+            self.log(f"✅ Created split files:\n{part1}\n{part2}")
+            return 0
+
+    def _concat_and_split_monolithic(self, td, faded, final_path: Path, total_dur: float) -> int:
+        """Legacy path: combine everything, then split the big file in two."""
+        ff = self._ffmpeg_bin
+        list_file = Path(td) / "concat.txt"
+        self._write_concat_list(list_file, faded)
+        cmd = self._concat_cmd(list_file, final_path, fade_start=total_dur - 2)
+        self.log("Combining with: " + " ".join(cmd))
+        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self._set_active_proc)
+        if rc != 0:
+            return rc
+
+        self.log("Splitting into PART 1 and PART 2")
+        part1 = final_path.with_name(final_path.stem + "_PART1.mp4")
+        part2 = final_path.with_name(final_path.stem + "_PART2.mp4")
+        half = total_dur / 2
+        # -ss before -i seeks by keyframe index instead of demuxing the whole
+        # first half; make_zero keeps the shifted timestamps copy-safe.
+        split_cmds = [
+            [ff, "-y", "-i", str(final_path), "-t", str(half),
+             "-c", "copy", "-avoid_negative_ts", "make_zero", str(part1)],
+            [ff, "-y", "-ss", str(half), "-i", str(final_path),
+             "-c", "copy", "-avoid_negative_ts", "make_zero", str(part2)]
+        ]
+        for cmd in split_cmds:
+            self.log("Splitting: " + " ".join(cmd))
+            run_subprocess(cmd, self.log)
+
+        final_path.unlink()  # remove the giant original
+        self.log(f"✅ Created split files:\n{part1}\n{part2}")
+        return 0
+
+    # ---------- Misc ----------
+    def open_in_shotcut_if_requested(self, output_path: Path):
+        if not self.open_in_shotcut.get():
+            return
+        exe = self.shotcut_path.get().strip() or which("shotcut") or which("shotcut.exe")
+        if not exe:
+            self.log("Shotcut not found. Set its path to auto-open.")
+            return
+        subprocess.Popen([exe, str(output_path)])
+        self.log("Opened in Shotcut.")
+
+    def install_autoeditor(self):
+        self.log("Installing Auto-Editor via pip...")
+        cmd = [sys.executable, "-m", "pip", "install", "--upgrade", "auto-editor"]
+        rc = run_subprocess(cmd, self.log, stop_event=self.stop_event, proc_setter=self._set_active_proc)
+        if rc == 0:
+            self.log("Auto-Editor installed or updated successfully.")
+        else:
+            self.log("Failed to install Auto-Editor.")
+            
+    DONE_SOUND = r"CHANGETOYOURDIRECTORY.mp4"
+
+    def _load_done_wav(self):
+        """
+        Decode DONE_SOUND to WAV bytes once (winsound can't play mp4, and
+        SND_MEMORY avoids re-reading a file on every completion). Cached on
+        first use; b"" means "tried and failed, don't retry".
+        """
+        wav = getattr(self, "_done_wav", None)
+        if wav is None:
+            wav = b""
+            src = Path(self.DONE_SOUND)
+            if src.is_file():
+                try:
+                    r = subprocess.run(
+                        [self._ffmpeg_bin, "-v", "error", "-i", str(src),
+                         "-vn", "-ac", "1", "-ar", "22050", "-f", "wav", "-"],
+                        capture_output=True,
+                        creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+                    )
+                    if r.returncode == 0:
+                        wav = r.stdout
+                except Exception:
+                    pass
+            self._done_wav = wav
+        return wav
+
+    def play_done_sound(self):
+        if winsound is None:
+            return
+        try:
+            wav = self._load_done_wav()
+            if wav:
+                winsound.PlaySound(wav, winsound.SND_MEMORY | winsound.SND_ASYNC)
+        except Exception as e:
+            self.log(f"⚠ Could not play sound: {e}")
+
+
+
+def main():
+    app = App()
+    app.mainloop()
+
+
+if __name__ == "__main__":
+    main()
+